@@ -0,0 +1,53 @@
+# neurotempo/brain/band_power.py
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# delta, theta, alpha, beta, gamma (Hz) — same edges as DataFilter.get_avg_band_powers
+BANDS_HZ = ((2.0, 4.0), (4.0, 8.0), (8.0, 13.0), (13.0, 30.0), (30.0, 45.0))
+
+
+def build_band_plan(n: int, fs: int, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hann window and band bin edges for an n-sample window at fs.
+    Edges hold the bin where each band starts plus the end of the last one;
+    bands are back-to-back, so their bins are contiguous runs.
+    Raises ValueError if the window is too short to give every band a bin
+    (reduceat on an empty run would return a bin instead of 0).
+    """
+    freqs = np.fft.rfftfreq(n, d=1.0 / float(fs))
+    hann = np.hanning(n).astype(dtype, copy=False)
+    edges_hz = [lo for lo, _ in BANDS_HZ] + [BANDS_HZ[-1][1]]
+    edges = np.searchsorted(freqs, edges_hz).astype(np.intp)
+    if np.any(np.diff(edges) <= 0):
+        raise ValueError("EEG window too short to resolve the frequency bands")
+    return hann, edges
+
+
+def relative_band_powers(
+    eeg: np.ndarray,
+    hann: np.ndarray,
+    edges: np.ndarray,
+    win: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Relative band powers per channel (Hann periodogram), averaged across
+    channels — the same shape of result as get_avg_band_powers.
+
+    eeg is (channels, n) and already mean-removed. One batched FFT over all
+    channels, then all band sums in a single reduceat sweep; only bins below
+    the top band edge are ever squared. win is optional scratch for the
+    windowed signal.
+    """
+    if win is None or win.shape != eeg.shape:
+        win = np.empty_like(eeg)
+    np.multiply(eeg, hann, out=win)
+    spec = np.fft.rfft(win, axis=1)[:, :edges[-1]]
+    power = spec.real * spec.real + spec.imag * spec.imag
+    bands = np.add.reduceat(power, edges[:-1], axis=1)
+    total = bands.sum(axis=1, keepdims=True)
+    rel = np.divide(bands, total, out=np.zeros_like(bands), where=total > 0.0)
+    return rel.mean(axis=0)
@@ -5,7 +5,46 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+def clamp01(v: float) -> float:
+    # Plain comparisons: np.clip on a scalar goes through ufunc dispatch + 0-d arrays
+    return 0.0 if v < 0.0 else (1.0 if v > 1.0 else v)
+
+
+class RunningMean:
+    """
+    Fixed-size ring buffer with a running sum.
+    Same result as deque(maxlen=n) + np.mean, but O(1) per push and no allocation.
+    """
+
+    def __init__(self, n: int):
+        self._buf = [0.0] * max(1, int(n))
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+
+    def clear(self):
+        self._buf = [0.0] * len(self._buf)
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+
+    def push(self, v: float) -> float:
+        buf = self._buf
+        n = len(buf)
+        i = self._idx
+        self._sum += v - buf[i]
+        buf[i] = v
+        self._idx = i = (i + 1) % n
+        if self._count < n:
+            self._count += 1
+        if i == 0:
+            # re-anchor once per lap so float drift can't accumulate over a long session
+            self._sum = sum(buf)
+        return self._sum / self._count
+
+
+# Immutable + slotted: snapshots are handed across threads and shared (e.g. a zero singleton)
+@dataclass(slots=True, frozen=True)
 class BrainMetrics:
     focus: float                # 0..1 (real)
     fatigue: float              # 0..1 (real)
@@ -28,6 +67,4 @@ class BrainAPI(ABC):
         raise NotImplementedError
 
     def sample_focus(self) -> float:
-        m = self.read_metrics()
-        v = float(m.focus)
-        return max(0.0, min(1.0, v))
\ No newline at end of file
+        return clamp01(float(self.read_metrics().focus))
\ No newline at end of file
@@ -24,16 +24,4 @@ class SimSessionBrain(BrainAPI):
     def read_metrics(self) -> BrainMetrics:
         if self._sim is None:
             self.start()
-
-        m = self._sim.read()
-
-        # clamp focus/fatigue
-        focus = max(0.0, min(1.0, float(m.focus)))
-        fatigue = max(0.0, min(1.0, float(m.fatigue)))
-
-        return BrainMetrics(
-            focus=focus,
-            fatigue=fatigue,
-            heart_rate=int(m.heart_rate),
-            spo2=int(m.spo2),
-        )
\ No newline at end of file
+        return self._sim.read()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import Optional, Tuple
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 from brainflow.board_shim import (
@@ -12,13 +14,39 @@ from brainflow.board_shim import (
 )
 from brainflow.data_filter import DataFilter
 
-from neurotempo.brain.brain_api import BrainAPI, BrainMetrics
+from neurotempo.brain.band_power import build_band_plan, relative_band_powers
+from neurotempo.brain.brain_api import BrainAPI, BrainMetrics, RunningMean, clamp01
+
+
+# Connection state (self._state)
+_STATE_DOWN = 0
+_STATE_CONNECTED = 1
+_STATE_DEGRADED = 2  # session is up but the last producer cycle raised
+
+# Shared "no data" value; returned instead of allocating a fresh one per cycle
+_ZERO_METRICS = BrainMetrics(0.0, 0.0, 0, 0)
 
 
 class MuseNotReady(Exception):
     pass
 
 
+def _next_fast_len(n: int) -> int:
+    # Smallest 2^a * 3^b * 5^c >= n: lengths pocketfft transforms without a slow prime factor
+    best = 1 << max(0, (n - 1).bit_length())
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            m = p35
+            while m < n:
+                m <<= 1
+            best = min(best, m)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
 class BrainFlowMuseBrain(BrainAPI):
     """
     Muse 2 backend (stable + anti-fake-focus + hiccup smoothing)
@@ -28,6 +56,8 @@ class BrainFlowMuseBrain(BrainAPI):
     ✅ Debounced worn detection
     ✅ Warm-up gate to avoid 0..50 jitter at the beginning
     ✅ NEW: Grace-hold (keeps last good metrics during short BLE hiccups)
+    ✅ Acquisition + DSP run on a background thread; read_metrics() only
+       returns the latest snapshot, so the UI tick never waits on BrainFlow
     """
 
     def __init__(
@@ -38,31 +68,98 @@ class BrainFlowMuseBrain(BrainAPI):
         smooth_n: int = 8,
         ppg_window_sec: float = 8.0,
         hr_band_hz: Tuple[float, float] = (0.8, 3.0),
+        update_sec: float = 1.0,
+        ppg_update_sec: float = 2.0,
     ):
         self.device_id = device_id
         self.timeout_s = float(timeout_s)
         self.window_sec = float(window_sec)
         self.smooth_n = max(2, int(smooth_n))
 
+        # Producer cadence. 1 Hz matches the UI polling rate the debounce /
+        # warm-up / smoothing read counts below were tuned for.
+        self.update_sec = max(0.05, float(update_sec))
+
         self.ppg_window_sec = float(ppg_window_sec)
+        # HR/SpO2 come from an 8 s window and barely move between producer
+        # cycles, so they're recomputed at this slower cadence
+        self.ppg_update_sec = max(self.update_sec, float(ppg_update_sec))
         self.hr_band_hz = (float(hr_band_hz[0]), float(hr_band_hz[1]))
 
         self.board_id = BoardIds.MUSE_2_BOARD.value
+        # Built once; set_device_id() writes through and start() only refreshes the timeout
         self.params = BrainFlowInputParams()
+        self.params.mac_address = device_id or ""
+        self.params.timeout = int(self.timeout_s)
 
         self.board: Optional[BoardShim] = None
-        self._connected = False
+        self._state = _STATE_DOWN
+
+        # Background producer + single-slot snapshot (reference swap is atomic under the GIL)
+        self._worker: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._latest = _ZERO_METRICS
+        self._last_error: Optional[Exception] = None  # set while DEGRADED
+
+        # Optional push hook, invoked on the producer thread after each freshly
+        # computed snapshot; grace, warm-up and stale-window returns are not
+        # pushed (UI code marshals it onto the Qt thread with a signal)
+        self.on_metrics: Optional[Callable[[BrainMetrics], None]] = None
+        self._good_seq = 0  # bumped by _compute_metrics on each real snapshot
+
+        # Fetches the PPG window (ancillary preset) and estimates HR/SpO2 from it
+        # while the producer handles EEG
+        self._pool: Optional[ThreadPoolExecutor] = None
 
         # EEG
         self.fs = 256
         self.eeg_channels: list[int] = []
+        self._eeg_idx = np.empty(0, dtype=np.intp)  # eeg_channels as an index array
+        self.ts_channel: int = -1
+
+        # EEG rows as a view (contiguous channels) or copied into a reused scratch
+        self._eeg_rows: Optional[slice] = None
+        self._eeg_scratch: Optional[np.ndarray] = None
+
+        # Ring of the last window of raw EEG, advanced by only the samples that
+        # arrived since the previous read (hop) instead of re-copying the window
+        self._ring: Optional[np.ndarray] = None
+        self._ring_idx = 0                    # oldest sample / next write position
+        self._ring_ts: Optional[float] = None  # timestamp of the newest sample held
+        self._hop_n = 0
+
+        # Centered EEG window, reused every read. float32 is plenty for UI metrics
+        # and halves the bytes the stats/FFT stream through.
+        self._eeg_f32: Optional[np.ndarray] = None
+        self._eeg_win: Optional[np.ndarray] = None  # Hann-windowed copy fed to the FFT
+        self._eeg_mean: Optional[np.ndarray] = None  # (channels, 1) window means
+
+        # Band-power constants for the fixed window length (built in start())
+        self._hann: Optional[np.ndarray] = None
+        self._band_edges: Optional[np.ndarray] = None  # bin index where each band starts + end of the last
+
+        # Skip a cycle (reuse the last snapshot) until this much new EEG has arrived
+        self._min_new_sec = 0.25
+        self._metrics_ts: Optional[float] = None  # newest sample timestamp last evaluated
 
         # PPG
         self.ppg_fs: int = 64
         self.ppg_channels: list[int] = []
-
-        self._focus_hist = deque(maxlen=self.smooth_n)
-        self._fatigue_hist = deque(maxlen=self.smooth_n)
+        # PPG rows are copied out of each BrainFlow read into this reused (channels, n) buffer
+        self._ppg_idx = np.empty(0, dtype=np.intp)
+        self._ppg_buf: Optional[np.ndarray] = None
+        self._ppg_next_t = 0.0                          # monotonic deadline for next HR/SpO2
+        self._ppg_cached: Tuple[int, int] = (0, 0)      # (heart_rate, spo2)
+
+        # HR estimator constants for the fixed PPG window length (built in start())
+        self._ppg_hamming: Optional[np.ndarray] = None
+        self._ppg_nfft = 0                               # zero-padded FFT length
+        self._ppg_freqs = np.empty(0, dtype=np.float64)
+        self._ppg_band_lo = 0                            # rfft bins [lo, hi) inside hr_band_hz
+        self._ppg_band_hi = 0
+
+        self._focus_hist = RunningMean(self.smooth_n)
+        self._fatigue_hist = RunningMean(self.smooth_n)
 
         # wearing/contact state (UI)
         self.last_valid_eeg_count: int = 0
@@ -72,16 +169,17 @@ class BrainFlowMuseBrain(BrainAPI):
         self.last_reject_reason: str = ""
 
         # Debounce + warmup
-        self._worn_hits = 0
-        self._not_worn_hits = 0
         self._debounce_needed = 3
+        # Last _debounce_needed worn votes packed as bits (newest = bit 0)
+        self._worn_mask = (1 << self._debounce_needed) - 1
+        self._worn_bits = 0
         self._warmup_reads_needed = 4
         self._warmup_reads_left = 0
 
         # ✅ Grace hold (hide short dropouts)
         self._grace_hold_sec = 2.5  # keep last good values up to this long
         self._grace_reads_left = 0
-        self._last_good = BrainMetrics(0.0, 0.0, 0, 0)
+        self._last_good = _ZERO_METRICS
 
     # -----------------------
     # Lifecycle
@@ -89,11 +187,9 @@ class BrainFlowMuseBrain(BrainAPI):
 
     def set_device_id(self, device_id: Optional[str]):
         self.device_id = device_id
+        self.params.mac_address = device_id or ""
 
     def start(self):
-        self.params = BrainFlowInputParams()
-        if self.device_id:
-            self.params.mac_address = self.device_id
         self.params.timeout = int(self.timeout_s)
 
         self.board = BoardShim(self.board_id, self.params)
@@ -122,6 +218,37 @@ class BrainFlowMuseBrain(BrainAPI):
             if not self.eeg_channels:
                 raise MuseNotReady("No EEG channels")
 
+            try:
+                self.ts_channel = int(BoardShim.get_timestamp_channel(self.board_id))
+            except Exception:
+                self.ts_channel = -1
+
+            ch = self.eeg_channels
+            self._eeg_idx = np.asarray(ch, dtype=np.intp)
+            n = int(self.window_sec * self.fs)
+            if ch == list(range(ch[0], ch[0] + len(ch))):
+                self._eeg_rows = slice(ch[0], ch[0] + len(ch))
+                self._eeg_scratch = None
+            else:
+                self._eeg_rows = None
+                self._eeg_scratch = np.empty((len(ch), n), dtype=np.float64)
+            self._eeg_f32 = np.empty((len(ch), n), dtype=np.float32)
+            self._eeg_win = np.empty((len(ch), n), dtype=np.float32)
+            self._eeg_mean = np.empty((len(ch), 1), dtype=np.float32)
+
+            self._ring = np.empty((len(ch), n), dtype=np.float32)
+            self._ring_idx = 0
+            self._ring_ts = None
+            # one producer period of samples + margin for scheduling jitter
+            self._hop_n = min(n, int(1.5 * self.update_sec * self.fs))
+
+            # Window and band edges only depend on (n, fs); validated once here
+            # so _band_powers() can reduce without guards
+            try:
+                self._hann, self._band_edges = build_band_plan(n, self.fs, np.float32)
+            except ValueError as e:
+                raise MuseNotReady(str(e))
+
             try:
                 self.ppg_channels = list(
                     BoardShim.get_ppg_channels(self.board_id, BrainFlowPresets.ANCILLARY_PRESET)
@@ -136,42 +263,61 @@ class BrainFlowMuseBrain(BrainAPI):
             except Exception:
                 self.ppg_fs = 64
 
-            # Flush ring buffer
-            try:
-                cnt = int(self.board.get_board_data_count())
-                if cnt > 0:
-                    self.board.get_board_data(cnt)
-            except Exception:
-                pass
-            try:
-                cnt2 = int(self.board.get_board_data_count(BrainFlowPresets.ANCILLARY_PRESET))
-                if cnt2 > 0:
-                    self.board.get_board_data(cnt2, BrainFlowPresets.ANCILLARY_PRESET)
-            except Exception:
-                pass
+            n_ppg = int(self.ppg_window_sec * self.ppg_fs)
+            self._ppg_idx = np.asarray(self.ppg_channels, dtype=np.intp)
+            self._ppg_buf = np.empty((len(self.ppg_channels), n_ppg), dtype=np.float64)
+            self._build_ppg_constants(n_ppg)
+
+            # No flush: a fresh session only holds samples from this stream, and
+            # draining them would just delay the first full window. The first
+            # producer cycle does a full (non-destructive) window read anyway.
 
-            self._connected = True
+            self._state = _STATE_CONNECTED
             self._focus_hist.clear()
             self._fatigue_hist.clear()
 
             self.last_valid_eeg_count = 0
             self.last_worn = False
             self.last_reject_reason = ""
+            self._metrics_ts = None
+            self._ppg_next_t = 0.0
+            self._ppg_cached = (0, 0)
 
             # warmup when we start streaming
-            self._worn_hits = 0
-            self._not_worn_hits = 0
+            self._worn_bits = 0
             self._warmup_reads_left = self._warmup_reads_needed
 
             # grace hold reset
             self._grace_reads_left = 0
-            self._last_good = BrainMetrics(0.0, 0.0, 0, 0)
+            self._last_good = _ZERO_METRICS
+
+            self._latest = _ZERO_METRICS
+            # Fresh Event per producer: a thread that outlived stop()'s join
+            # keeps seeing its own (set) Event instead of a cleared shared one
+            self._stop_event = threading.Event()
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="muse-ppg")
+            self._worker = threading.Thread(
+                target=self._loop, args=(self._stop_event,), name="muse-eeg", daemon=True
+            )
+            self._worker.start()
 
         except Exception as e:
             self.stop()
             raise MuseNotReady(f"Failed to start Muse: {e!r}")
 
     def stop(self):
+        # Called from the UI thread, so don't wait out a BrainFlow fetch or PPG
+        # job: the producer's own Event (now set) keeps it from publishing, and
+        # its board reads fail softly once the session is released below
+        self._stop_event.set()
+        worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout=0.1)
+        self._worker = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
         try:
             if self.board:
                 try:
@@ -184,17 +330,58 @@ class BrainFlowMuseBrain(BrainAPI):
                     pass
         finally:
             self.board = None
-            self._connected = False
+            self._state = _STATE_DOWN
             self._focus_hist.clear()
             self._fatigue_hist.clear()
             self.last_valid_eeg_count = 0
             self.last_worn = False
             self.last_reject_reason = ""
-            self._worn_hits = 0
-            self._not_worn_hits = 0
+            self._metrics_ts = None
+            self._ring_ts = None
+            self._ppg_next_t = 0.0
+            self._ppg_cached = (0, 0)
+            self._worn_bits = 0
             self._warmup_reads_left = 0
             self._grace_reads_left = 0
-            self._last_good = BrainMetrics(0.0, 0.0, 0, 0)
+            self._last_good = _ZERO_METRICS
+            self._latest = _ZERO_METRICS
+            self._last_error = None
+
+    def _loop(self, stop_event: threading.Event):
+        next_t = time.monotonic()
+        while not stop_event.is_set():
+            seq = self._good_seq
+            try:
+                out = self._compute_metrics()
+                # stop() may have run while we computed; never publish after it
+                if stop_event.is_set():
+                    break
+                self._latest = out
+                self._state = _STATE_CONNECTED
+                self._last_error = None
+            except Exception as e:
+                if stop_event.is_set():
+                    break
+                # Degraded until the next clean cycle; readers get the error
+                self.last_reject_reason = f"compute_error: {e!r}"
+                self._last_error = e
+                self._state = _STATE_DEGRADED
+            else:
+                cb = self.on_metrics
+                if cb is not None and self._good_seq != seq:
+                    # a failing listener (e.g. a deleted Qt bridge at shutdown)
+                    # must not degrade the brain for every other reader
+                    try:
+                        cb(out)
+                    except Exception:
+                        pass
+
+            # Deadline-based so the cadence doesn't drift with compute time
+            next_t += self.update_sec
+            now = time.monotonic()
+            if next_t < now:
+                next_t = now
+            stop_event.wait(next_t - now)
 
     # -----------------------
     # Helpers
@@ -215,31 +402,141 @@ class BrainFlowMuseBrain(BrainAPI):
         except Exception:
             return None
 
-    def _channel_valid_mask(self, data: np.ndarray) -> np.ndarray:
-        eeg = data[self.eeg_channels, :]
-        stds = np.std(eeg, axis=1)
-        return (stds > 3.0) & (stds < 250.0)
+    def _data_count(self, preset=None) -> int:
+        # O(1) ring-buffer fill level; no samples are copied
+        if not self.board:
+            return 0
+        try:
+            if preset is None:
+                return int(self.board.get_board_data_count())
+            return int(self.board.get_board_data_count(preset))
+        except Exception:
+            return 0
+
+    def _read_ppg_window(self) -> Optional[np.ndarray]:
+        n_ppg = int(self.ppg_window_sec * self.ppg_fs)
+        # Cheap fill-level check first; a short window would be fetched only to be dropped
+        if self._data_count(BrainFlowPresets.ANCILLARY_PRESET) < n_ppg:
+            return None
+        ppg_data = self._get_current_data(n_ppg, preset=BrainFlowPresets.ANCILLARY_PRESET)
+        if ppg_data is None or ppg_data.shape[1] < n_ppg:
+            return None
+        # Keep only the PPG rows, in the same memory every read; the fresh
+        # BrainFlow array (all ancillary rows) is dropped right away
+        if self._ppg_buf is None or self._ppg_buf.shape[1] != ppg_data.shape[1]:
+            return ppg_data[self._ppg_idx, :]
+        return np.take(ppg_data, self._ppg_idx, axis=0, out=self._ppg_buf)
+
+    def _ppg_metrics(self) -> Tuple[int, int]:
+        # Runs on the PPG pool thread: window fetch + HR + SpO2 -> (heart_rate, spo2)
+        ppg_data = self._read_ppg_window()
+        if ppg_data is None:
+            return 0, 0
+        try:
+            # rows follow ppg_channels order
+            red = ppg_data[0]
+            ir = ppg_data[1] if ppg_data.shape[0] > 1 else None
+            sig_for_hr = ir if ir is not None else red
+            hr = self._estimate_hr_from_ppg(sig_for_hr, self.ppg_fs)
+
+            spo2 = 0
+            if ir is not None and hr > 0:
+                oxy = DataFilter.get_oxygen_level(ir, red, self.ppg_fs)
+                spo2 = int(round(float(oxy))) if oxy is not None else 0
+                if spo2 < 70 or spo2 > 100:
+                    spo2 = 0
+            return int(hr), spo2
+        except Exception:
+            return 0, 0
+
+    def _eeg(self, data: np.ndarray) -> np.ndarray:
+        # Basic slicing returns a view; fancy indexing would copy every tick
+        if self._eeg_rows is not None:
+            return data[self._eeg_rows]
+        if self._eeg_scratch is not None and self._eeg_scratch.shape[1] == data.shape[1]:
+            return np.take(data, self._eeg_idx, axis=0, out=self._eeg_scratch)
+        return data[self._eeg_idx, :]
+
+    def _ring_push(self, new: np.ndarray):
+        ring = self._ring
+        n = ring.shape[1]
+        k = new.shape[1]
+        if k >= n:
+            ring[:] = new[:, k - n:]
+            self._ring_idx = 0
+            return
+        i = self._ring_idx
+        first = min(k, n - i)
+        ring[:, i:i + first] = new[:, :first]
+        ring[:, :k - first] = new[:, first:]
+        self._ring_idx = (i + k) % n
+
+    def _advance_window(self, n: int) -> bool:
+        """
+        Bring the EEG ring up to date. Normally only the last hop of samples is
+        copied out of BrainFlow and the ones newer than _ring_ts are appended.
+        Reads stay non-destructive: the sensor check and the connection
+        watchdog peek the same BrainFlow buffer.
+        """
+        if self._ring is None or self._data_count() < n:
+            return False
+
+        ts_ch = self.ts_channel
+        if ts_ch >= 0 and self._ring_ts is not None:
+            data = self._get_current_data(self._hop_n)
+            if data is None or data.shape[1] == 0:
+                return False
+            ts = data[ts_ch]
+            start = int(np.searchsorted(ts, self._ring_ts, side="right"))
+            # start == 0: every sample in the hop is new, so we may have missed
+            # some in between -> fall through to a full refetch
+            if start > 0 and ts[-1] >= self._ring_ts:
+                if start < data.shape[1]:
+                    self._ring_push(self._eeg(data[:, start:]))
+                    self._ring_ts = float(ts[-1])
+                return True
+
+        data = self._get_current_data(n)
+        if data is None or data.shape[1] < n:
+            return False
+        self._ring[:] = self._eeg(data)
+        self._ring_idx = 0
+        self._ring_ts = float(data[ts_ch, -1]) if ts_ch >= 0 else None
+        return True
+
+    def _centered_eeg(self) -> np.ndarray:
+        # Unroll the ring into time order while removing the channel means, in
+        # one pass into the reused buffer; validity stats and the PSD both use it
+        ring = self._ring
+        i = self._ring_idx
+        w = ring.shape[1] - i
+        out = self._eeg_f32
+        means = np.mean(ring, axis=1, keepdims=True, out=self._eeg_mean)
+        np.subtract(ring[:, i:], means, out=out[:, :w])
+        np.subtract(ring[:, :i], means, out=out[:, w:])
+        return out
+
+    def _channel_valid_mask(self, eeg: np.ndarray) -> np.ndarray:
+        # eeg is already centered, so variance (ddof=0) is the mean square: one fused
+        # reduction, compared against squared std limits (3..250 uV) to skip the sqrt
+        var = np.einsum("ij,ij->i", eeg, eeg) / eeg.shape[1]
+        return (var > 3.0 ** 2) & (var < 250.0 ** 2)
 
     def _vote_worn(self, worn_now: bool) -> bool:
-        prev = self.last_worn
-
-        if worn_now:
-            self._worn_hits += 1
-            self._not_worn_hits = 0
-        else:
-            self._not_worn_hits += 1
-            self._worn_hits = 0
-
-        if self._worn_hits >= self._debounce_needed:
-            self.last_worn = True
-        elif self._not_worn_hits >= self._debounce_needed:
-            self.last_worn = False
+        bits = ((self._worn_bits << 1) | int(worn_now)) & self._worn_mask
+        self._worn_bits = bits
 
-        # If state changed, start warmup suppression
-        if self.last_worn != prev:
-            self._warmup_reads_left = self._warmup_reads_needed
+        # Flip only after _debounce_needed identical votes in a row (all ones /
+        # all zeros); any mixed history keeps the current state
+        worn = self.last_worn
+        if bits == 0 or bits == self._worn_mask:
+            new_worn = bits != 0
+            if new_worn != worn:
+                # state changed -> start warmup suppression
+                self._warmup_reads_left = self._warmup_reads_needed
+                self.last_worn = worn = new_worn
 
-        return self.last_worn
+        return worn
 
     def _noise_sanity_gate(self, theta: float, alpha: float, beta: float) -> bool:
         at = alpha + theta
@@ -251,68 +548,115 @@ class BrainFlowMuseBrain(BrainAPI):
             return False
         return True
 
-    def _focus_from_bands(self, theta: float, alpha: float, beta: float) -> float:
-        raw = (1.15 * beta) + (0.25 * alpha) - (0.90 * theta)
-        x = (raw + 0.25) / 0.75
-        return float(np.clip(x, 0.0, 1.0))
+    def _scores_from_bands(self, theta: float, alpha: float, beta: float) -> Tuple[float, float]:
+        # (focus, fatigue) from relative band powers, both in one call
+        focus_raw = (1.15 * beta) + (0.25 * alpha) - (0.90 * theta)
+        fatigue_raw = (1.10 * theta) + (0.20 * alpha) - (0.60 * beta)
+        return clamp01((focus_raw + 0.25) / 0.75), clamp01((fatigue_raw + 0.10) / 0.70)
+
+    def _band_powers(self, eeg: np.ndarray) -> Tuple[float, float, float]:
+        # Unchanged windows never get here: _compute_metrics returns the last
+        # snapshot until _min_new_sec of new EEG has arrived
+        _, theta, alpha, beta, _ = relative_band_powers(
+            eeg, self._hann, self._band_edges, win=self._eeg_win
+        )
+        return float(theta), float(alpha), float(beta)
 
-    def _fatigue_from_bands(self, theta: float, alpha: float, beta: float) -> float:
-        raw = (1.10 * theta) + (0.20 * alpha) - (0.60 * beta)
-        x = (raw + 0.10) / 0.70
-        return float(np.clip(x, 0.0, 1.0))
+    def _build_ppg_constants(self, n: int):
+        # Window and HR-band bins only depend on (n, ppg_fs)
+        self._ppg_nfft = _next_fast_len(n)
+        freqs = np.fft.rfftfreq(self._ppg_nfft, d=1.0 / float(self.ppg_fs))
+        lo, hi = self.hr_band_hz
+        self._ppg_hamming = np.hamming(n)
+        self._ppg_freqs = freqs
+        self._ppg_band_lo = int(np.searchsorted(freqs, lo, side="left"))
+        self._ppg_band_hi = int(np.searchsorted(freqs, hi, side="right"))
 
     def _estimate_hr_from_ppg(self, sig: np.ndarray, fs: int) -> int:
         if sig.size < int(2 * fs):
             return 0
-        x = sig.astype(np.float64)
-        x = x - np.mean(x)
-        xw = x * np.hamming(len(x))
-
-        freqs = np.fft.rfftfreq(len(xw), d=1.0 / float(fs))
-        spec = np.abs(np.fft.rfft(xw))
-
-        lo, hi = self.hr_band_hz
-        mask = (freqs >= lo) & (freqs <= hi)
-        if not np.any(mask):
+        if self._ppg_hamming is None or self._ppg_hamming.shape[0] != sig.size:
+            self._build_ppg_constants(sig.size)
+        lo_i, hi_i = self._ppg_band_lo, self._ppg_band_hi
+        if hi_i <= lo_i:
             return 0
 
-        f_peak = freqs[mask][int(np.argmax(spec[mask]))]
+        # One fresh buffer (sig is still needed for SpO2), then window it in place
+        x = np.subtract(sig, sig.mean(), dtype=np.float64)
+        x *= self._ppg_hamming
+        band = np.fft.rfft(x, n=self._ppg_nfft)[lo_i:hi_i]
+
+        # Peak of |X|^2 over the contiguous HR-band slice (same argmax as |X|)
+        f_peak = self._ppg_freqs[lo_i + int(np.argmax(band.real * band.real + band.imag * band.imag))]
         hr = int(round(float(f_peak) * 60.0))
         if hr < 35 or hr > 200:
             return 0
         return hr
 
     def _begin_grace_hold(self):
-        # convert seconds to "read cycles"
-        reads = int(max(1, round(self._grace_hold_sec / max(self.window_sec, 0.5))))
+        # convert seconds to producer cycles
+        reads = int(max(1, round(self._grace_hold_sec / self.update_sec)))
         self._grace_reads_left = reads
 
     def _grace_return(self) -> BrainMetrics:
         if self._grace_reads_left > 0:
             self._grace_reads_left -= 1
             return self._last_good
-        return BrainMetrics(0.0, 0.0, 0, 0)
+        return _ZERO_METRICS
 
     # -----------------------
     # Metrics
     # -----------------------
 
-    def read_metrics(self) -> BrainMetrics:
-        if not self._connected or not self.board:
-            raise MuseNotReady("Muse not connected")
+    @property
+    def _connected(self) -> bool:
+        return self._state != _STATE_DOWN
 
+    def read_metrics(self) -> BrainMetrics:
+        state = self._state
+        if state == _STATE_CONNECTED:
+            return self._latest
+        if state == _STATE_DEGRADED:
+            raise MuseNotReady(f"compute error: {self._last_error!r}")
+        raise MuseNotReady("Muse not connected")
+
+    def _compute_metrics(self) -> BrainMetrics:
+        # Runs on the producer thread only
         self.last_reject_reason = ""
 
         n = int(self.window_sec * self.fs)
-        data = self._get_current_data(n)
 
         # If we fail to read enough data, treat as hiccup -> grace hold
-        if data is None or data.shape[1] < n:
+        if not self._advance_window(n):
             if self._grace_reads_left == 0 and (self._last_good.heart_rate != 0 or self._last_good.focus != 0.0):
                 self._begin_grace_hold()
             return self._grace_return()
 
-        valid = self._channel_valid_mask(data)
+        # The window has barely moved (BLE stall / short cycle): nothing to re-evaluate
+        ts = self._ring_ts
+        if ts is not None:
+            if self._metrics_ts is not None and ts - self._metrics_ts < self._min_new_sec:
+                return self._latest
+            self._metrics_ts = ts
+
+        # Overlap the whole PPG path (fetch + HR + SpO2) with the EEG DSP below.
+        # PPG only when worn and past warm-up (as of the previous cycle); the
+        # next refresh is scheduled at submit so an early return below can't
+        # turn into a PPG job every cycle
+        ppg_fut: Optional[Future] = None
+        now = time.monotonic()
+        if (
+            self.ppg_channels
+            and self._pool is not None
+            and self.last_worn
+            and self._warmup_reads_left == 0
+            and now >= self._ppg_next_t
+        ):
+            ppg_fut = self._pool.submit(self._ppg_metrics)
+            self._ppg_next_t = now + self.ppg_update_sec
+
+        eeg = self._centered_eeg()
+        valid = self._channel_valid_mask(eeg)
         self.last_valid_eeg_count = int(np.sum(valid))
 
         worn_now = self.last_valid_eeg_count > 0
@@ -324,17 +668,13 @@ class BrainFlowMuseBrain(BrainAPI):
                 self._begin_grace_hold()
             self._focus_hist.clear()
             self._fatigue_hist.clear()
+            # Recompute HR/SpO2 as soon as the headband is back on
+            self._ppg_next_t = 0.0
+            self._ppg_cached = (0, 0)
             return self._grace_return()
 
         # Band powers
-        rel_powers, _ = DataFilter.get_avg_band_powers(
-            data,
-            self.eeg_channels,
-            self.fs,
-            True
-        )
-        _, theta, alpha, beta, _ = rel_powers
-        theta = float(theta); alpha = float(alpha); beta = float(beta)
+        theta, alpha, beta = self._band_powers(eeg)
 
         # Noise sanity gate -> grace hold (don’t spam “not worn” for 1–2 hiccup windows)
         if not self._noise_sanity_gate(theta, alpha, beta):
@@ -350,39 +690,18 @@ class BrainFlowMuseBrain(BrainAPI):
             self._warmup_reads_left -= 1
             self._focus_hist.clear()
             self._fatigue_hist.clear()
-            return BrainMetrics(0.0, 0.0, 0, 0)
-
-        focus = self._focus_from_bands(theta, alpha, beta)
-        fatigue = self._fatigue_from_bands(theta, alpha, beta)
-
-        self._focus_hist.append(focus)
-        self._fatigue_hist.append(fatigue)
+            return _ZERO_METRICS
 
-        focus_s = float(np.mean(self._focus_hist))
-        fatigue_s = float(np.mean(self._fatigue_hist))
+        focus, fatigue = self._scores_from_bands(theta, alpha, beta)
 
-        # PPG only when worn and stable
-        hr = 0
-        spo2 = 0
-        if self.ppg_channels:
-            n_ppg = int(self.ppg_window_sec * self.ppg_fs)
-            ppg_data = self._get_current_data(n_ppg, preset=BrainFlowPresets.ANCILLARY_PRESET)
+        focus_s = self._focus_hist.push(focus)
+        fatigue_s = self._fatigue_hist.push(fatigue)
 
-            if ppg_data is not None and ppg_data.shape[1] >= n_ppg:
-                try:
-                    red = ppg_data[self.ppg_channels[0]]
-                    ir = ppg_data[self.ppg_channels[1]] if len(self.ppg_channels) > 1 else None
-                    sig_for_hr = ir if ir is not None else red
-                    hr = self._estimate_hr_from_ppg(sig_for_hr, self.ppg_fs)
-
-                    if ir is not None and hr > 0:
-                        oxy = DataFilter.get_oxygen_level(ir, red, self.ppg_fs)
-                        spo2 = int(round(float(oxy))) if oxy is not None else 0
-                        if spo2 < 70 or spo2 > 100:
-                            spo2 = 0
-                except Exception:
-                    hr = 0
-                    spo2 = 0
+        # PPG only when worn and stable; between refreshes reuse the last result
+        hr, spo2 = self._ppg_cached
+        if ppg_fut is not None:
+            hr, spo2 = ppg_fut.result()
+            self._ppg_cached = (hr, spo2)
 
         out = BrainMetrics(
             focus=focus_s,
@@ -394,6 +713,7 @@ class BrainFlowMuseBrain(BrainAPI):
         # ✅ Save as last good + clear grace hold
         self._last_good = out
         self._grace_reads_left = 0
+        self._good_seq += 1
 
         return out
 
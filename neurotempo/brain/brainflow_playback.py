@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 import time
-from collections import deque
 
 import numpy as np
 from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
-from brainflow.data_filter import DataFilter, WindowOperations, DetrendOperations
 
-from neurotempo.brain.brain_api import BrainAPI, BrainMetrics
+from neurotempo.brain.band_power import build_band_plan, relative_band_powers
+from neurotempo.brain.brain_api import BrainAPI, BrainMetrics, RunningMean, clamp01
 
 
 class BrainFlowPlaybackBrain(BrainAPI):
@@ -21,28 +20,38 @@ class BrainFlowPlaybackBrain(BrainAPI):
         self.playback_file = playback_file
         self.window_sec = float(window_sec)
 
+        self.params = BrainFlowInputParams()
+        self.params.file = playback_file
+
         self.board: BoardShim | None = None
         self.fs: int = 256
         self.eeg_channels: list[int] = []
 
-        self.focus_hist = deque(maxlen=10)
-        self.fatigue_hist = deque(maxlen=10)
+        # Band-power constants for the fixed window length (built in start())
+        self._hann: np.ndarray | None = None
+        self._band_edges: np.ndarray | None = None
+
+        self.focus_hist = RunningMean(10)
+        self.fatigue_hist = RunningMean(10)
 
     # -----------------------
     # Lifecycle
     # -----------------------
 
     def start(self) -> None:
-        params = BrainFlowInputParams()
-        params.file = self.playback_file
-
-        self.board = BoardShim(BoardIds.PLAYBACK_FILE_BOARD.value, params)
+        self.board = BoardShim(BoardIds.PLAYBACK_FILE_BOARD.value, self.params)
         self.board.prepare_session()
         self.board.start_stream(45000)
 
         self.fs = BoardShim.get_sampling_rate(BoardIds.PLAYBACK_FILE_BOARD.value)
         self.eeg_channels = BoardShim.get_eeg_channels(BoardIds.PLAYBACK_FILE_BOARD.value)
 
+        n = int(self.window_sec * self.fs)
+        try:
+            self._hann, self._band_edges = build_band_plan(n, self.fs)
+        except ValueError as e:
+            raise RuntimeError(str(e))
+
     def stop(self) -> None:
         if self.board:
             try:
@@ -64,9 +73,9 @@ class BrainFlowPlaybackBrain(BrainAPI):
             raise RuntimeError("BrainFlowPlaybackBrain not started")
 
         n = int(self.window_sec * self.fs)
-        data = self.board.get_current_board_data(n)
 
-        if data.shape[1] < n:
+        # Check the fill level (O(1)) before copying a window out
+        if self.board.get_board_data_count() < n:
             # warmup
             return BrainMetrics(
                 focus=0.5,
@@ -75,37 +84,26 @@ class BrainFlowPlaybackBrain(BrainAPI):
                 spo2=98,
             )
 
-        eeg = data[self.eeg_channels, :]
-
-        # Detrend
-        for ch in range(eeg.shape[0]):
-            DataFilter.detrend(eeg[ch], DetrendOperations.CONSTANT.value)
+        data = self.board.get_current_board_data(n)
 
-        # Band powers
-        bands = DataFilter.get_avg_band_powers(
-            eeg,
-            self.eeg_channels,
-            self.fs,
-            True
-        )
+        # Fancy indexing already hands back a private copy, so detrend it in place
+        eeg = data[self.eeg_channels, -n:]
 
-        # bands[0] = relative powers
-        delta, theta, alpha, beta, gamma = bands[0]
+        # Detrend (constant), then relative band powers averaged across channels
+        eeg -= eeg.mean(axis=1, keepdims=True)
+        delta, theta, alpha, beta, gamma = relative_band_powers(eeg, self._hann, self._band_edges)
 
         # Simple, stable proxies (placeholder — replace later)
         focus = beta / max(alpha + theta, 1e-6)
         fatigue = theta / max(alpha + beta, 1e-6)
 
         # Normalize
-        focus = float(np.clip(focus, 0.0, 1.0))
-        fatigue = float(np.clip(fatigue, 0.0, 1.0))
-
-        self.focus_hist.append(focus)
-        self.fatigue_hist.append(fatigue)
+        focus = clamp01(float(focus))
+        fatigue = clamp01(float(fatigue))
 
         # Smooth a bit
-        focus = float(np.mean(self.focus_hist))
-        fatigue = float(np.mean(self.fatigue_hist))
+        focus = self.focus_hist.push(focus)
+        fatigue = self.fatigue_hist.push(fatigue)
 
         return BrainMetrics(
             focus=focus,
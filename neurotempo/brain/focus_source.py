@@ -1,5 +1,5 @@
 # neurotempo/brain/focus_source.py
-import random
+import numpy as np
 
 
 class FocusSource:
@@ -7,6 +7,19 @@ class FocusSource:
     Temporary simulated focus source.
     Later you will replace this with BrainFlow-derived focus.
     """
+    _BATCH = 1024
+
+    def __init__(self):
+        # Draw samples in batches; one PCG64 call per _BATCH reads
+        self._rng = np.random.default_rng()
+        self._buf: list[float] = []
+        self._i = 0
+
     def sample_focus(self) -> float:
         # returns 0.0–1.0
-        return max(0.0, min(1.0, random.uniform(0.45, 0.75)))
\ No newline at end of file
+        if self._i >= len(self._buf):
+            self._buf = self._rng.uniform(0.45, 0.75, size=self._BATCH).tolist()
+            self._i = 0
+        v = self._buf[self._i]
+        self._i += 1
+        return v
@@ -1,9 +1,9 @@
 # neurotempo/brain/muse/muse_simulator.py
 
-import random
+import numpy as np
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SensorStatus:
     TP9: float
     AF7: float
@@ -17,17 +17,33 @@ class MuseSimulator:
     Values are 0..1 where <0.40 = "no contact" (red), >=0.40 = "contact" (green).
     Replace this with your real Muse/BrainFlow reader later.
     """
-    def read(self) -> SensorStatus:
+    _BATCH = 1024
+
+    def __init__(self):
+        # Readings live column-wise in a (4, _BATCH) float32 buffer (one row per
+        # sensor, TP9/AF7/AF8/TP10), filled a batch at a time and handed out
+        # column by column; per-sensor stats over recent reads are a row reduction
+        self._rng = np.random.default_rng()
+        self._buf = np.empty((4, self._BATCH), dtype=np.float32)
+        self._i = self._BATCH
+
+    def _refill(self):
+        shape = self._buf.shape
         # bias toward "good" so it doesn't feel broken
-        def v():
-            r = random.random()
-            if r < 0.15:
-                return random.uniform(0.05, 0.35)  # red sometimes
-            return random.uniform(0.55, 1.00)      # mostly green
+        red = self._rng.random(shape) < 0.15
+        np.copyto(self._buf, self._rng.uniform(0.55, 1.00, shape))           # mostly green
+        np.copyto(self._buf, self._rng.uniform(0.05, 0.35, shape), where=red)  # red sometimes
+        self._i = 0
+
+    def read(self) -> SensorStatus:
+        if self._i >= self._BATCH:
+            self._refill()
+        tp9, af7, af8, tp10 = self._buf[:, self._i].tolist()
+        self._i += 1
 
         return SensorStatus(
-            TP9=v(),
-            AF7=v(),
-            AF8=v(),
-            TP10=v(),
-        )
\ No newline at end of file
+            TP9=tp9,
+            AF7=af7,
+            AF8=af8,
+            TP10=tp10,
+        )
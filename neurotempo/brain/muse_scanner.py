@@ -2,34 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import List, Dict
 from bleak import BleakScanner
 
 
+# InteraXon (Muse) 16-bit service UUID 0xFE8D. Filtering on it lets the OS BLE
+# stack drop every other advertiser before our callback runs.
+MUSE_SERVICE_UUID = "0000fe8d-0000-1000-8000-00805f9b34fb"
+
 def _looks_like_muse(name: str) -> bool:
     n = (name or "").strip().lower()
     return n.startswith("muse")
 
 
 async def scan_nearby_muse(timeout_s: float = 4.0) -> List[Dict]:
+    """
+    Scan for Muse headbands for timeout_s and return every one in range,
+    strongest signal first.
+    """
     found: dict[str, Dict] = {}
 
-    devices = await BleakScanner.discover(timeout=timeout_s)
-
-    for d in devices:
-        name = (d.name or "").strip()
-        if not name:
-            md = getattr(d, "metadata", {}) or {}
-            name = (md.get("local_name") or "").strip()
-
+    def on_adv(d, adv):
+        name = (d.name or adv.local_name or "").strip()
+        # name check kept as a safety net behind the service filter
         if not _looks_like_muse(name):
-            continue
+            return
 
         mac = d.address
-        rssi = getattr(d, "rssi", None)
+        rssi = adv.rssi
 
         prev = found.get(mac)
         if prev is None or (rssi is not None and (prev["rssi"] is None or rssi > prev["rssi"])):
             found[mac] = {"id": mac, "name": name or "Muse", "rssi": rssi}
 
-    return sorted(found.values(), key=lambda x: (x["rssi"] is None, -(x["rssi"] or -999)))
\ No newline at end of file
+    async with BleakScanner(detection_callback=on_adv, service_uuids=[MUSE_SERVICE_UUID]):
+        await asyncio.sleep(timeout_s)
+
+    return sorted(found.values(), key=lambda x: (x["rssi"] is None, -(x["rssi"] or -999)))
@@ -1,11 +1,13 @@
 # neurotempo/brain/sensor_quality.py
 from __future__ import annotations
 
+import time
+
 import numpy as np
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SensorQuality:
     AF7: float
     AF8: float
@@ -13,6 +15,20 @@ class SensorQuality:
     TP10: float
 
 
+# Results are binary per channel, so there are only 16 possible values: build
+# them once and index by the AF7|AF8<<1|TP9<<2|TP10<<3 contact bitmask
+_QUALITY_BY_MASK = tuple(
+    SensorQuality(
+        AF7=float(m & 1),
+        AF8=float((m >> 1) & 1),
+        TP9=float((m >> 2) & 1),
+        TP10=float((m >> 3) & 1),
+    )
+    for m in range(16)
+)
+_MASK_WEIGHTS = np.array([1, 2, 4, 8], dtype=np.intp)
+
+
 class MuseSensorQuality:
     """
     REAL sensor contact estimation using EEG amplitude stability.
@@ -26,36 +42,144 @@ class MuseSensorQuality:
         window_sec: float = 1.0,
         min_std_uv: float = 3.0,
         max_std_uv: float = 80.0,
+        update_hz: float = 8.0,
     ):
         self.brain = brain
         self.window_sec = float(window_sec)
         self.min_std = float(min_std_uv)
         self.max_std = float(max_std_uv)
 
+        # Callers may poll faster than contact can visibly change; reuse the
+        # last result within one period
+        self._period = 1.0 / max(0.1, float(update_hz))
+        self._last_t = 0.0
+        self._last_status: SensorQuality | None = None
+
+        # Resolved from the backend on first read (and again after it restarts)
+        self._bound_channels: list[int] | None = None
+        self._n = 0
+        self._ch_idx: np.ndarray | None = None
+        self._ch_rows: slice | None = None  # same rows as a slice when contiguous
+        self._var_lo = self.min_std * self.min_std
+        self._var_hi = self.max_std * self.max_std
+
+        # Window ring with running per-channel sum / sum of squares. Each read
+        # only pulls the recent hop of samples and absorbs the ones newer than
+        # _ring_ts (located via the timestamp row), evicting the oldest.
+        self._ts_ch = -1
+        self._hop = 0
+        self._ring: np.ndarray | None = None
+        self._ring_idx = 0
+        self._ring_ts: float | None = None
+        self._sum = np.zeros(4, dtype=np.float64)
+        self._ss = np.zeros(4, dtype=np.float64)
+
+    def _bind_brain(self):
+        # start() assigns a fresh eeg_channels list, so its identity marks a new session
+        channels = self.brain.eeg_channels
+        if len(channels) < 4:
+            raise RuntimeError("Not enough EEG channels")
+        self._bound_channels = channels
+        self._n = int(self.window_sec * self.brain.fs)
+        self._ch_idx = np.asarray(channels[:4], dtype=np.intp)
+        first = int(self._ch_idx[0])
+        contiguous = list(channels[:4]) == list(range(first, first + 4))
+        self._ch_rows = slice(first, first + 4) if contiguous else None
+        self._last_status = None
+
+        self._ts_ch = int(getattr(self.brain, "ts_channel", -1))
+        # 0.5 s of samples: twice the sensor screen's 250 ms poll, longer gaps refetch
+        self._hop = min(self._n, int(0.5 * self.brain.fs))
+        self._ring = np.zeros((4, self._n), dtype=np.float64)
+        self._ring_idx = 0
+        self._ring_ts = None
+
+    def _rows(self, data: np.ndarray) -> np.ndarray:
+        # Slice view when the channels are adjacent rows; fancy indexing otherwise
+        return data[self._ch_rows] if self._ch_rows is not None else data[self._ch_idx]
+
+    def _reset_ring(self, data: np.ndarray):
+        # Straight into the ring: a row slice copy, or np.take(out=) so the
+        # non-contiguous layout doesn't allocate an intermediate block
+        if self._ch_rows is not None:
+            self._ring[:] = data[self._ch_rows]
+        else:
+            np.take(data, self._ch_idx, axis=0, out=self._ring)
+        self._ring_idx = 0
+        self._sum = self._ring.sum(axis=1)
+        self._ss = np.einsum("ij,ij->i", self._ring, self._ring)
+        self._ring_ts = float(data[self._ts_ch, -1]) if self._ts_ch >= 0 else None
+
+    def _absorb(self, new: np.ndarray):
+        # new: (4, k) with k < n. Swap the k oldest samples for the new ones and
+        # update the running sums by the difference.
+        ring = self._ring
+        n = ring.shape[1]
+        k = new.shape[1]
+        i = self._ring_idx
+        pos = (np.arange(i, i + k) % n) if i + k > n else slice(i, i + k)
+        old = ring[:, pos]
+        self._sum += new.sum(axis=1) - old.sum(axis=1)
+        self._ss += np.einsum("ij,ij->i", new, new) - np.einsum("ij,ij->i", old, old)
+        ring[:, pos] = new
+        self._ring_idx = (i + k) % n
+        if self._ring_idx < i:
+            # re-anchor once per lap so float drift can't accumulate
+            self._sum = ring.sum(axis=1)
+            self._ss = np.einsum("ij,ij->i", ring, ring)
+
     def read(self) -> SensorQuality:
         if not self.brain.board or not self.brain._connected:
             raise RuntimeError("Muse not connected")
 
-        fs = self.brain.fs
-        n = int(self.window_sec * fs)
+        if self._ch_idx is None or self.brain.eeg_channels is not self._bound_channels:
+            self._bind_brain()
 
-        data = self.brain.board.get_current_board_data(n)
-        if data is None or data.shape[1] < n:
+        now = time.monotonic()
+        if self._last_status is not None and now - self._last_t < self._period:
+            return self._last_status
+
+        self._last_status = self._measure()
+        self._last_t = now
+        return self._last_status
+
+    def _advance(self):
+        n = self._n
+        board = self.brain.board
+
+        if board.get_board_data_count() < n:
             raise RuntimeError("Not enough EEG samples")
 
-        eeg = data[self.brain.eeg_channels, :]
+        ts_ch = self._ts_ch
+        if ts_ch >= 0 and self._ring_ts is not None:
+            data = board.get_current_board_data(self._hop)
+            if data is not None and data.shape[1] > 0:
+                ts = data[ts_ch]
+                start = int(np.searchsorted(ts, self._ring_ts, side="right"))
+                # start == 0: the whole hop is new, so samples may have been
+                # missed in between -> full refetch below
+                if start > 0 and ts[-1] >= self._ring_ts:
+                    if start < data.shape[1]:
+                        self._absorb(self._rows(data[:, start:]))
+                        self._ring_ts = float(ts[-1])
+                    return
+
+        data = board.get_current_board_data(n)
+        if data is None or data.shape[1] < n:
+            raise RuntimeError("Not enough EEG samples")
+        self._reset_ring(data)
 
-        # Standard deviation per channel (µV)
-        stds = np.std(eeg, axis=1)
+    def _measure(self) -> SensorQuality:
+        self._advance()
+        n = self._n
 
-        def ok(std):
-            return float(self.min_std <= std <= self.max_std)
+        # Per-channel variance (µV²) from the running sum and sum of squares,
+        # compared against the squared std limits.
+        s = self._sum / n
+        var = self._ss / n - s * s
 
+        # Good/bad per channel in one vector comparison, folded into a bitmask.
         # Muse 2 channel order:
         # [AF7, AF8, TP9, TP10]
-        return SensorQuality(
-            AF7=ok(stds[0]),
-            AF8=ok(stds[1]),
-            TP9=ok(stds[2]),
-            TP10=ok(stds[3]),
-        )
\ No newline at end of file
+        ok = (var >= self._var_lo) & (var <= self._var_hi)
+        return _QUALITY_BY_MASK[int(ok.dot(_MASK_WEIGHTS))]
\ No newline at end of file
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 import time
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SensorState:
     eeg: bool = False
     ppg: bool = False
@@ -14,13 +14,19 @@ class SensorSimulator:
     Simulates sensors turning green over time.
     Later we replace this with real BrainFlow status checks.
     """
+    # Turn-on times (ns after construction) for eeg / ppg / accel
+    _EEG_NS = 2_000_000_000
+    _PPG_NS = 4_000_000_000
+    _ACCEL_NS = 6_000_000_000
+
     def __init__(self):
-        self.start_time = time.time()
+        # Integer monotonic clock: no float conversion, immune to wall-clock changes
+        self.start_ns = time.monotonic_ns()
 
     def read(self) -> SensorState:
-        t = time.time() - self.start_time
+        t = time.monotonic_ns() - self.start_ns
         return SensorState(
-            eeg=(t > 2.0),
-            ppg=(t > 4.0),
-            accel=(t > 6.0),
+            eeg=(t > self._EEG_NS),
+            ppg=(t > self._PPG_NS),
+            accel=(t > self._ACCEL_NS),
         )
\ No newline at end of file
@@ -1,31 +1,52 @@
 # neurotempo/brain/sim_session.py
-import random
-from dataclasses import dataclass
+import numpy as np
 
-@dataclass
-class SessionMetrics:
-    focus: float      # 0..1
-    fatigue: float    # 0..1
-    heart_rate: int   # bpm
-    spo2: int         # %
+from neurotempo.brain.brain_api import BrainMetrics
 
 class SessionSimulator:
+    _BATCH = 1024
+
     def __init__(self, baseline_focus: float):
         self.focus = baseline_focus
         self.fatigue = 0.25
         self.hr = 72
         self.spo2 = 98
 
-    def read(self) -> SessionMetrics:
+        # Drift steps are drawn _BATCH ticks at a time, one row per tick
+        self._rng = np.random.default_rng()
+        self._steps: list[tuple] = []
+        self._i = 0
+
+    def _refill(self):
+        n = self._BATCH
+        rng = self._rng
+        self._steps = list(zip(
+            rng.uniform(-0.04, 0.02, n).tolist(),
+            rng.uniform(0.00, 0.03, n).tolist(),
+            rng.integers(-2, 4, n).tolist(),   # same range as randint(-2, 3)
+            rng.integers(-1, 2, n).tolist(),   # same range as randint(-1, 1)
+        ))
+        self._i = 0
+
+    def _step(self):
+        if self._i >= len(self._steps):
+            self._refill()
+        d_focus, d_fatigue, d_hr, d_spo2 = self._steps[self._i]
+        self._i += 1
+
         # simulate slow drift
-        self.focus = max(0.0, min(1.0, self.focus + random.uniform(-0.04, 0.02)))
-        self.fatigue = max(0.0, min(1.0, self.fatigue + random.uniform(0.00, 0.03)))
-        self.hr = max(55, min(110, self.hr + random.randint(-2, 3)))
-        self.spo2 = max(94, min(100, self.spo2 + random.randint(-1, 1)))
+        self.focus = max(0.0, min(1.0, self.focus + d_focus))
+        self.fatigue = max(0.0, min(1.0, self.fatigue + d_fatigue))
+        self.hr = max(55, min(110, self.hr + d_hr))
+        self.spo2 = max(94, min(100, self.spo2 + d_spo2))
+
+    def read(self) -> BrainMetrics:
+        self._step()
 
-        return SessionMetrics(
+        # values are already in range, so they go out as BrainMetrics directly
+        return BrainMetrics(
             focus=self.focus,
             fatigue=self.fatigue,
             heart_rate=self.hr,
             spo2=self.spo2,
-        )
\ No newline at end of file
+        )
@@ -1,10 +1,30 @@
 import sys
 
 # Keep references alive so PyObjC targets don't get garbage-collected
-_KEEPALIVE = []
+# (keyed by id(panel) for O(1) removal on close)
+_KEEPALIVE = {}
+
+# Immutable Cocoa styling objects, built on first popup and reused after
+_COLORS = {}
+_FONTS = {}
+
+# (panel, title_field, message_field, target), built on first show and reused
+_SHARED = None
+
+# The ObjC class is defined ONCE, on the first popup, so merely importing this
+# module doesn't pull in the PyObjC bridge (macOS only)
+_TARGET_CLASS = None
+
+# (NSScreen, NSApplication, accessory policy): the only AppKit names a repeat
+# show touches, resolved once
+_APPKIT = None
+
+
+def _ensure_target_class():
+    global _TARGET_CLASS
+    if _TARGET_CLASS is not None:
+        return _TARGET_CLASS
 
-# Define the ObjC class ONCE (not inside the function), macOS only
-if sys.platform == "darwin":
     import objc
     from Cocoa import NSObject
 
@@ -25,7 +45,6 @@ if sys.platform == "darwin":
 
             # selector: close:
             def close_(self, sender):
-                global _KEEPALIVE
                 try:
                     if getattr(self, "_panel", None) is not None:
                         self._panel.orderOut_(None)
@@ -38,22 +57,42 @@ if sys.platform == "darwin":
                         pass
 
                     # Remove keepalive entry for this panel
-                    try:
-                        panel = getattr(self, "_panel", None)
-                        if panel is not None:
-                            _KEEPALIVE = [x for x in _KEEPALIVE if x[0] is not panel]
-                    except Exception:
-                        pass
+                    panel = getattr(self, "_panel", None)
+                    if panel is not None:
+                        _KEEPALIVE.pop(id(panel), None)
 
+    _TARGET_CLASS = NTBreakCloseTarget
+    return _TARGET_CLASS
 
-def show_break_popup_center(title: str, message: str):
-    if sys.platform != "darwin":
-        raise RuntimeError("Native popup only supported on macOS")
 
+def _ensure_style():
+    if _COLORS:
+        return
+    from Cocoa import NSColor, NSFont
+
+    # PyObjC proxies own a retain, so module references outlive any pool
+    _COLORS["clear"] = NSColor.clearColor()
+    _COLORS["card_bg"] = NSColor.colorWithCalibratedWhite_alpha_(0.06, 0.98)
+    _COLORS["title"] = NSColor.whiteColor()
+    _COLORS["message"] = NSColor.colorWithCalibratedWhite_alpha_(0.92, 0.85)
+    _FONTS["title"] = NSFont.boldSystemFontOfSize_(18)
+    _FONTS["message"] = NSFont.systemFontOfSize_(13)
+
+
+def _appkit():
+    global _APPKIT
+    if _APPKIT is None:
+        from AppKit import (
+            NSScreen,
+            NSApplication,
+            NSApplicationActivationPolicyAccessory,
+        )
+        _APPKIT = (NSScreen, NSApplication, NSApplicationActivationPolicyAccessory)
+    return _APPKIT
+
+
+def _build_panel(app, prev_policy, w: int, h: int):
     from AppKit import (
-        NSScreen,
-        NSApplication,
-        NSApplicationActivationPolicyAccessory,
         NSStatusWindowLevel,
         NSWindowCollectionBehaviorMoveToActiveSpace,
         NSWindowCollectionBehaviorFullScreenAuxiliary,
@@ -65,31 +104,13 @@ def show_break_popup_center(title: str, message: str):
         NSButton,
         NSWindowStyleMaskNonactivatingPanel,
         NSWindowStyleMaskBorderless,
-        NSColor,
-        NSFont,
         NSBackingStoreBuffered,
         NSRoundedBezelStyle,
     )
 
-    # Put app into "Accessory" mode so it doesn't steal focus
-    app = NSApplication.sharedApplication()
-    prev_policy = None
-    try:
-        prev_policy = app.activationPolicy()
-        app.setActivationPolicy_(NSApplicationActivationPolicyAccessory)
-    except Exception:
-        prev_policy = None
-
-    # Center on visible frame
-    w, h = 420, 180
-    screen = NSScreen.mainScreen()
-    frame = screen.visibleFrame()
-    x = frame.origin.x + (frame.size.width - w) / 2
-    y = frame.origin.y + (frame.size.height - h) / 2
-
     style = NSWindowStyleMaskNonactivatingPanel | NSWindowStyleMaskBorderless
     panel = NSPanel.alloc().initWithContentRect_styleMask_backing_defer_(
-        NSMakeRect(x, y, w, h),
+        NSMakeRect(0, 0, w, h),
         style,
         NSBackingStoreBuffered,
         False
@@ -103,7 +124,7 @@ def show_break_popup_center(title: str, message: str):
     )
 
     panel.setOpaque_(False)
-    panel.setBackgroundColor_(NSColor.clearColor())
+    panel.setBackgroundColor_(_COLORS["clear"])
     panel.setHasShadow_(True)
     panel.setHidesOnDeactivate_(False)
 
@@ -113,7 +134,7 @@ def show_break_popup_center(title: str, message: str):
     bg = NSTextField.alloc().initWithFrame_(NSMakeRect(0, 0, w, h))
     bg.setBezeled_(False)
     bg.setDrawsBackground_(True)
-    bg.setBackgroundColor_(NSColor.colorWithCalibratedWhite_alpha_(0.06, 0.98))
+    bg.setBackgroundColor_(_COLORS["card_bg"])
     bg.setEditable_(False)
     bg.setSelectable_(False)
     bg.setStringValue_("")
@@ -125,9 +146,8 @@ def show_break_popup_center(title: str, message: str):
     t.setDrawsBackground_(False)
     t.setEditable_(False)
     t.setSelectable_(False)
-    t.setTextColor_(NSColor.whiteColor())
-    t.setFont_(NSFont.boldSystemFontOfSize_(18))
-    t.setStringValue_(title)
+    t.setTextColor_(_COLORS["title"])
+    t.setFont_(_FONTS["title"])
     content.addSubview_(t)
 
     # Message
@@ -136,9 +156,8 @@ def show_break_popup_center(title: str, message: str):
     m.setDrawsBackground_(False)
     m.setEditable_(False)
     m.setSelectable_(False)
-    m.setTextColor_(NSColor.colorWithCalibratedWhite_alpha_(0.92, 0.85))
-    m.setFont_(NSFont.systemFontOfSize_(13))
-    m.setStringValue_(message)
+    m.setTextColor_(_COLORS["message"])
+    m.setFont_(_FONTS["message"])
     m.setUsesSingleLineMode_(False)
     content.addSubview_(m)
 
@@ -147,18 +166,65 @@ def show_break_popup_center(title: str, message: str):
     btn.setTitle_("Got it")
     btn.setBezelStyle_(NSRoundedBezelStyle)
 
-    target = NTBreakCloseTarget.alloc().initWithPanel_app_prevPolicy_(panel, app, prev_policy)
+    target = _ensure_target_class().alloc().initWithPanel_app_prevPolicy_(panel, app, prev_policy)
     btn.setTarget_(target)
     btn.setAction_("close:")
     content.addSubview_(btn)
 
-    # Show without activating (PyObjC name differs by version)
-    if hasattr(panel, "orderFrontRegardless"):
-        panel.orderFrontRegardless()
-    else:
-        panel.orderFront_(None)
+    return panel, t, m, target
+
 
-    # Keep references alive (don't attach attributes to NSPanel)
-    _KEEPALIVE.append((panel, target, prev_policy))
+def show_break_popup_center(title: str, message: str):
+    global _SHARED
+    if sys.platform != "darwin":
+        raise RuntimeError("Native popup only supported on macOS")
 
-    return panel
\ No newline at end of file
+    import objc
+    NSScreen, NSApplication, NSApplicationActivationPolicyAccessory = _appkit()
+
+    # PyObjC hands back autoreleased proxies (NSString/NSColor/NSFont...) that
+    # otherwise linger until the next Cocoa runloop drain; panel and target
+    # escape the pool via _SHARED / _KEEPALIVE.
+    with objc.autorelease_pool():
+        _ensure_style()
+        app = NSApplication.sharedApplication()
+        already_up = _SHARED is not None and _SHARED[0].isVisible()
+
+        # Put app into "Accessory" mode so it doesn't steal focus. If the popup
+        # is still showing, keep the policy recorded by the first show.
+        if already_up:
+            prev_policy = _SHARED[3]._prev_policy
+        else:
+            prev_policy = None
+            try:
+                prev_policy = app.activationPolicy()
+                app.setActivationPolicy_(NSApplicationActivationPolicyAccessory)
+            except Exception:
+                prev_policy = None
+
+        # Built once; later shows only swap the text and re-center
+        w, h = 420, 180
+        if _SHARED is None:
+            _SHARED = _build_panel(app, prev_policy, w, h)
+        panel, t, m, target = _SHARED
+        target._prev_policy = prev_policy
+
+        t.setStringValue_(title)
+        m.setStringValue_(message)
+
+        # Center on visible frame (the main screen may change between shows)
+        frame = NSScreen.mainScreen().visibleFrame()
+        x = frame.origin.x + (frame.size.width - w) / 2
+        y = frame.origin.y + (frame.size.height - h) / 2
+        panel.setFrameOrigin_((x, y))
+
+        # Show without activating (PyObjC name differs by version)
+        if hasattr(panel, "orderFrontRegardless"):
+            panel.orderFrontRegardless()
+        else:
+            panel.orderFront_(None)
+
+        # Keep references alive (don't attach attributes to NSPanel)
+        _KEEPALIVE[id(panel)] = (panel, target, prev_policy)
+
+    return panel
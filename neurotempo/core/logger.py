@@ -1,24 +1,37 @@
-import csv
+import atexit
 from datetime import datetime
 from pathlib import Path
 
+_FLUSH_EVERY = 30  # rows between explicit flushes (~30 s at 1 Hz)
+# Values are purely numeric/ISO timestamps, so no CSV quoting is ever needed.
+_ROW_FMT = "%s,%.4f,%.4f,%d,%d\n"
+
+
 class SessionLogger:
     def __init__(self, out_dir: str = "logs"):
         Path(out_dir).mkdir(parents=True, exist_ok=True)
         ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self.path = Path(out_dir) / f"session_{ts}.csv"
 
-        self._file = self.path.open("w", newline="", encoding="utf-8")
-        self._writer = csv.writer(self._file)
-        self._writer.writerow(["timestamp", "focus", "fatigue", "heart_rate", "spo2"])
+        self._file = self.path.open("w", newline="", encoding="utf-8", buffering=65536)
+        self._write = self._file.write
+        self._write("timestamp,focus,fatigue,heart_rate,spo2\n")
+        self._since_flush = 0
+        atexit.register(self.close)
 
     def log(self, focus: float, fatigue: float, hr: int, spo2: int):
         ts = datetime.now().isoformat(timespec="seconds")
-        self._writer.writerow([ts, f"{focus:.4f}", f"{fatigue:.4f}", hr, spo2])
-        self._file.flush()
+        self._write(_ROW_FMT % (ts, focus, fatigue, hr, spo2))
+        self._since_flush += 1
+        if self._since_flush >= _FLUSH_EVERY:
+            self._file.flush()
+            self._since_flush = 0
 
     def close(self):
         try:
+            if not self._file.closed:
+                self._file.flush()
             self._file.close()
         except Exception:
-            pass
\ No newline at end of file
+            pass
+        atexit.unregister(self.close)
@@ -1,5 +1,4 @@
 import sys
-import subprocess
 
 
 def notify(title: str, message: str):
@@ -12,6 +11,7 @@ def notify(title: str, message: str):
     try:
         if sys.platform == "darwin":
             # macOS: reliable Notification Center via AppleScript
+            import subprocess
             script = f'display notification "{message}" with title "{title}"'
             subprocess.run(["osascript", "-e", script], check=False)
             return
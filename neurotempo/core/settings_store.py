@@ -1,7 +1,7 @@
 import json
-from dataclasses import dataclass, asdict
-from pathlib import Path
-from PySide6.QtCore import QStandardPaths
+from dataclasses import dataclass, asdict, replace
+
+from neurotempo.core.storage import app_data_dir
 
 
 @dataclass
@@ -19,13 +19,21 @@ class AppSettings:
 
 class SettingsStore:
     def __init__(self):
-        base = Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
-        base.mkdir(parents=True, exist_ok=True)
-        self.path = base / "settings.json"
+        self.path = app_data_dir() / "settings.json"
+
+        # Parsed settings keyed on the file's mtime; callers get copies so they
+        # can mutate what load() returns without touching the cache.
+        self._cache: AppSettings | None = None
+        self._cache_mtime: int = -1
 
     def load(self) -> AppSettings:
-        if not self.path.exists():
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
             return AppSettings()
+        if self._cache is not None and mtime == self._cache_mtime:
+            return replace(self._cache)
+
         try:
             data = json.loads(self.path.read_text(encoding="utf-8"))
         except Exception:
@@ -35,8 +43,14 @@ class SettingsStore:
         for k, v in data.items():
             if hasattr(s, k):
                 setattr(s, k, v)
-        return s
+        self._cache = s
+        self._cache_mtime = mtime
+        return replace(s)
 
     def save(self, settings: AppSettings) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(asdict(settings), indent=2), encoding="utf-8")
\ No newline at end of file
+        self.path.write_text(json.dumps(asdict(settings), indent=2), encoding="utf-8")
+        try:
+            self._cache_mtime = self.path.stat().st_mtime_ns
+            self._cache = replace(settings)
+        except OSError:
+            self._cache = None
\ No newline at end of file
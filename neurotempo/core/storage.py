@@ -1,4 +1,7 @@
+import atexit
+import functools
 import json
+import os
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -7,7 +10,9 @@ from typing import Any, Dict, List, Optional
 from PySide6.QtCore import QStandardPaths
 
 
-def _app_data_dir() -> Path:
+@functools.lru_cache(maxsize=1)
+def app_data_dir() -> Path:
+    # Process-constant location, so the mkdir only needs to happen once
     base = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
     p = Path(base)
     p.mkdir(parents=True, exist_ok=True)
@@ -15,7 +20,7 @@ def _app_data_dir() -> Path:
 
 
 def sessions_path() -> Path:
-    return _app_data_dir() / "sessions.json"
+    return app_data_dir() / "sessions.jsonl"
 
 
 def _now_iso() -> str:
@@ -37,24 +42,88 @@ class SessionRecord:
 class SessionStore:
     def __init__(self, path: Optional[Path] = None):
         self.path = path or sessions_path()
+        self._fh = None  # append handle, opened on first append and kept open
 
     def load(self) -> List[Dict[str, Any]]:
         if not self.path.exists():
-            return []
+            self._migrate_legacy()
+            if not self.path.exists():
+                return []
+
+        items: List[Dict[str, Any]] = []
         try:
             with self.path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data if isinstance(data, list) else []
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a crash mid-append
+                    if isinstance(item, dict):
+                        items.append(item)
         except Exception:
             return []
+        return items
 
     def append(self, record: SessionRecord) -> None:
-        items = self.load()
-        items.append(asdict(record))
+        if self._fh is None:
+            if not self.path.exists():
+                self._migrate_legacy()
+            self._fh = self.path.open("a", encoding="utf-8", buffering=8192)
+            atexit.register(self.close)
+            if not self._ends_with_newline():
+                # a crash mid-append left a torn line; terminate it so the new
+                # record starts on its own line instead of being glued onto it
+                self._fh.write("\n")
+        # One record per line: appending never reads or rewrites history.
+        # flush() hands the line to the OS; fsync is left to close().
+        self._fh.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+        self._fh.flush()
+
+    def _ends_with_newline(self) -> bool:
+        try:
+            with self.path.open("rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except OSError:
+            return True
+
+    def close(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is None:
+            return
+        try:
+            fh.flush()
+            os.fsync(fh.fileno())
+        except OSError:
+            pass
+        finally:
+            fh.close()
+            atexit.unregister(self.close)
+
+    def _migrate_legacy(self) -> None:
+        """Convert the old pretty-printed sessions.json list to JSON lines once."""
+        legacy = self.path.with_suffix(".json")
+        if legacy == self.path or not legacy.exists():
+            return
+        try:
+            with legacy.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return
+        if not isinstance(data, list):
+            return
 
         tmp = self.path.with_suffix(".tmp")
         with tmp.open("w", encoding="utf-8") as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+            for item in data:
+                if isinstance(item, dict):
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
         tmp.replace(self.path)
 
     def append_from_summary(self, summary: Dict[str, Any]) -> None:
@@ -2,6 +2,28 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFrame
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication
 
+# Single sheet set on the popup itself; children are matched by objectName
+_POPUP_QSS = """
+    QFrame {
+        background: rgba(11,15,20,0.96);
+        border: 1px solid rgba(255,255,255,0.12);
+        border-radius: 18px;
+    }
+    QLabel#breakTitle { font-size: 20px; font-weight: 900; }
+    QLabel#breakMessage {
+        font-size: 14px; color: rgba(231,238,247,0.80); font-weight: 650;
+    }
+    QPushButton#breakOk {
+        background: rgba(255,255,255,0.10);
+        border: 1px solid rgba(255,255,255,0.18);
+        border-radius: 12px;
+        padding: 10px 14px;
+        font-weight: 750;
+    }
+    QPushButton#breakOk:hover { background: rgba(255,255,255,0.16); }
+    QPushButton#breakOk:pressed { background: rgba(255,255,255,0.22); }
+"""
+
 
 class BreakPopup(QWidget):
     """
@@ -22,47 +44,30 @@ class BreakPopup(QWidget):
 
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setFocusPolicy(Qt.NoFocus)
+        self.setObjectName("breakPopup")
+        self.setStyleSheet(_POPUP_QSS)
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
 
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background: rgba(11,15,20,0.96);
-                border: 1px solid rgba(255,255,255,0.12);
-                border-radius: 18px;
-            }
-        """)
         lay = QVBoxLayout(card)
         lay.setContentsMargins(22, 18, 22, 18)
         lay.setSpacing(10)
 
         title_lbl = QLabel(title)
-        title_lbl.setStyleSheet("font-size: 20px; font-weight: 900;")
+        title_lbl.setObjectName("breakTitle")
         title_lbl.setAlignment(Qt.AlignLeft)
 
         msg_lbl = QLabel(message)
         msg_lbl.setWordWrap(True)
-        msg_lbl.setStyleSheet(
-            "font-size: 14px; color: rgba(231,238,247,0.80); font-weight: 650;"
-        )
+        msg_lbl.setObjectName("breakMessage")
         msg_lbl.setAlignment(Qt.AlignLeft)
 
         btn = QPushButton("Got it")
         btn.clicked.connect(self.close)
         btn.setCursor(Qt.PointingHandCursor)
-        btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255,255,255,0.10);
-                border: 1px solid rgba(255,255,255,0.18);
-                border-radius: 12px;
-                padding: 10px 14px;
-                font-weight: 750;
-            }
-            QPushButton:hover { background: rgba(255,255,255,0.16); }
-            QPushButton:pressed { background: rgba(255,255,255,0.22); }
-        """)
+        btn.setObjectName("breakOk")
 
         lay.addWidget(title_lbl)
         lay.addWidget(msg_lbl)
@@ -1,11 +1,44 @@
 # neurotempo/ui/calibration.py
 import sys
+import time
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar, QApplication
-from PySide6.QtCore import Qt, QTimer
+import numpy as np
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar
+from PySide6.QtCore import Qt, QTimer, QObject, Signal, QPropertyAnimation
 
 from neurotempo.brain.brainflow_muse import MuseNotReady
 
+# One sheet for the whole screen, parsed once; children are matched by
+# objectName and the progress bar flips between states via a dynamic property
+_CALIBRATION_QSS = """
+    QLabel#calTitle { font-size: 28px; font-weight: 800; }
+    QLabel#calInstructions { font-size: 15px; color: rgba(231,238,247,0.75); }
+    QLabel#calCheck { font-size: 44px; font-weight: 900; color: #22c55e; }
+    QLabel#calStatus { color: rgba(231,238,247,0.75); }
+
+    QProgressBar#calProgress {
+        border: 1px solid rgba(255,255,255,0.14);
+        border-radius: 10px;
+        background: rgba(255,255,255,0.06);
+        height: 20px;
+    }
+    QProgressBar#calProgress::chunk {
+        background: rgba(255,255,255,0.22);
+        border-radius: 10px;
+    }
+    QProgressBar#calProgress[done="true"] {
+        border: 1px solid rgba(255,255,255,0.18);
+    }
+    QProgressBar#calProgress[done="true"]::chunk {
+        background: #22c55e;
+    }
+"""
+
+
+class _SampleBridge(QObject):
+    # emitted from the brain's producer thread; delivered queued on the UI thread
+    sample = Signal(float)
+
 
 class CalibrationScreen(QWidget):
     def __init__(self, seconds: int, brain, on_done):
@@ -14,21 +47,25 @@ class CalibrationScreen(QWidget):
         self.brain = brain
         self.on_done = on_done
 
-        self._elapsed = 0
+        self._deadline_armed = False  # set by the first post-warm-up sample
         self._running = False
-        self._samples = []
+        # contiguous sample buffer (~1 sample/s); grows only if a brain pushes faster
+        self._samples = np.empty(max(1, self.seconds) + 8, dtype=np.float64)
+        self._n = 0
 
         # ignore a few initial samples to avoid "first seconds" instability
         self._warmup_samples_to_skip = 2
         self._warmup_seen = 0
 
-        # --- Smooth progress animation state
-        self._anim_timer = QTimer(self)
-        self._anim_timer.setInterval(16)  # ~60fps
-        self._anim_timer.timeout.connect(self._animate_progress)
-        self._display_value = 0.0
-        self._target_value = 0.0
-        self._ease = 0.16  # (0.12–0.20 feels good)
+        # Brains with an on_metrics hook push samples as they are produced;
+        # others are polled from the timer
+        self._push = hasattr(brain, "on_metrics")
+        self._last_sample_t = 0.0
+        # consecutive watchdog firings without a pushed sample; give up at the limit
+        self._stalls = 0
+        self._max_stalls = 6  # 6 x 2.5 s = 15 s
+        self._bridge = _SampleBridge(self)
+        self._bridge.sample.connect(self._on_sample)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(40, 40, 40, 40)
@@ -37,7 +74,7 @@ class CalibrationScreen(QWidget):
 
         self.title = QLabel(f"Calibration ({self.seconds} seconds)")
         self.title.setAlignment(Qt.AlignCenter)
-        self.title.setStyleSheet("font-size: 28px; font-weight: 800;")
+        self.title.setObjectName("calTitle")
 
         self.instructions = QLabel(
             "Sit still and blink three times.\n"
@@ -45,49 +82,26 @@ class CalibrationScreen(QWidget):
         )
         self.instructions.setAlignment(Qt.AlignCenter)
         self.instructions.setWordWrap(True)
-        self.instructions.setStyleSheet("font-size: 15px; color: rgba(231,238,247,0.75);")
+        self.instructions.setObjectName("calInstructions")
 
         # ✅ Green check icon (hidden until complete)
         self.check = QLabel("✓")
         self.check.setAlignment(Qt.AlignCenter)
-        self.check.setStyleSheet("font-size: 44px; font-weight: 900; color: #22c55e;")
+        self.check.setObjectName("calCheck")
         self.check.hide()
 
         self.progress = QProgressBar()
+        self.progress.setObjectName("calProgress")
         self.progress.setRange(0, 100)
         self.progress.setValue(0)
         self.progress.setFixedWidth(520)
         self.progress.setTextVisible(False)
 
-        self._progress_style_running = """
-            QProgressBar {
-                border: 1px solid rgba(255,255,255,0.14);
-                border-radius: 10px;
-                background: rgba(255,255,255,0.06);
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background: rgba(255,255,255,0.22);
-                border-radius: 10px;
-            }
-        """
-        self._progress_style_done = """
-            QProgressBar {
-                border: 1px solid rgba(255,255,255,0.18);
-                border-radius: 10px;
-                background: rgba(255,255,255,0.06);
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background: #22c55e;
-                border-radius: 10px;
-            }
-        """
-        self.progress.setStyleSheet(self._progress_style_running)
-
         self.status = QLabel("Starting…")
         self.status.setAlignment(Qt.AlignCenter)
-        self.status.setStyleSheet("color: rgba(231,238,247,0.75);")
+        self.status.setObjectName("calStatus")
+
+        self.setStyleSheet(_CALIBRATION_QSS)
 
         root.addWidget(self.title)
         root.addWidget(self.instructions)
@@ -96,10 +110,24 @@ class CalibrationScreen(QWidget):
         root.addWidget(self.progress)
         root.addWidget(self.status)
 
+        # push: one-shot stall watchdog, re-armed by every sample;
+        # poll: sampling at 1Hz
         self.timer = QTimer(self)
-        self.timer.setInterval(1000)  # sample + timekeeping at 1Hz
+        self.timer.setTimerType(Qt.PreciseTimer)  # no coarse-timer quantization
+        self.timer.setSingleShot(self._push)
+        self.timer.setInterval(2500 if self._push else 1000)
         self.timer.timeout.connect(self._tick)
 
+        # Completion is one deadline, and the bar fill is a single property
+        # animation over the same span, so nothing polls to move the bar
+        self._finish_timer = QTimer(self)
+        self._finish_timer.setTimerType(Qt.PreciseTimer)
+        self._finish_timer.setSingleShot(True)
+        self._finish_timer.timeout.connect(self._finish)
+
+        self._progress_anim = QPropertyAnimation(self.progress, b"value", self)
+        self._progress_anim.setEndValue(100)
+
     def showEvent(self, event):
         super().showEvent(event)
         self.start()
@@ -109,31 +137,53 @@ class CalibrationScreen(QWidget):
             return
 
         self._running = True
-        self._elapsed = 0
-        self._samples = []
+        self._deadline_armed = False
+        self._n = 0
         self._warmup_seen = 0
+        self._stalls = 0
         self.check.hide()
 
         # ensure intro is visible at start
         self.title.show()
         self.instructions.show()
 
-        # reset smooth animation
-        self._display_value = 0.0
-        self._target_value = 0.0
+        self._progress_anim.stop()
         self.progress.setValue(0)
 
-        self.progress.setStyleSheet(self._progress_style_running)
+        self._set_progress_done(False)
         self.status.setText("Calibrating…")
 
+        self._last_sample_t = time.monotonic()
+        if self._push:
+            self.brain.on_metrics = self._push_sample
         self.timer.start()
-        self._anim_timer.start()
+
+    def _push_sample(self, m):
+        self._bridge.sample.emit(float(m.focus))
+
+    def _detach(self):
+        if self._push and getattr(self.brain, "on_metrics", None) == self._push_sample:
+            self.brain.on_metrics = None
+
+    def _set_progress_done(self, done: bool):
+        if self.progress.property("done") == done:
+            return
+        self.progress.setProperty("done", done)
+        # re-resolve just this widget against the already-parsed sheet
+        style = self.progress.style()
+        style.unpolish(self.progress)
+        style.polish(self.progress)
 
     def _play_success_feedback(self):
         try:
             if sys.platform == "darwin":
-                import subprocess
-                subprocess.run(["osascript", "-e", "beep 1"], check=False)
+                try:
+                    # direct AppKit call; no process spawn on the UI thread
+                    from AppKit import NSBeep
+                    NSBeep()
+                except ImportError:
+                    import subprocess
+                    subprocess.Popen(["osascript", "-e", "beep 1"])
             elif sys.platform.startswith("win"):
                 try:
                     import winsound
@@ -143,29 +193,35 @@ class CalibrationScreen(QWidget):
         except Exception:
             pass
 
-    def _animate_progress(self):
-        self._display_value += (self._target_value - self._display_value) * self._ease
-        v = int(max(0.0, min(100.0, self._display_value)))
-        self.progress.setValue(v)
-
-        if (not self._running) and abs(self._target_value - self._display_value) < 0.15:
-            self.progress.setValue(int(self._target_value))
-            self._anim_timer.stop()
+    def _stop_timers(self):
+        self._detach()
+        self.timer.stop()
+        self._finish_timer.stop()
+        self._progress_anim.stop()
 
     def _stop_with_message(self, msg: str, err: Exception | None = None):
         self._running = False
-        if self.timer.isActive():
-            self.timer.stop()
-        if self._anim_timer.isActive():
-            self._anim_timer.stop()
+        self._stop_timers()
         self.status.setText(msg)
         if err is not None:
             print("[Neurotempo] Calibration error:", repr(err))
 
     def _tick(self):
+        if not self._running:
+            return
+        if self._push:
+            # watchdog fired: no sample for 2.5 s, so probe the brain directly
+            read = self.brain.read_metrics
+        else:
+            # at most one sample per elapsed second, even if backlogged ticks
+            # are delivered back to back
+            if time.monotonic() - self._last_sample_t < 0.5:
+                return
+            read = self.brain.sample_focus
+
         # sample REAL focus for baseline calculation
         try:
-            f = float(self.brain.sample_focus())
+            f = read()
         except MuseNotReady as e:
             self._stop_with_message("Muse not ready.\nTurn it on and wear it.", e)
             return
@@ -173,58 +229,85 @@ class CalibrationScreen(QWidget):
             self._stop_with_message("EEG error.\nRetry.", e)
             return
 
+        if self._push:
+            # Still alive but nothing real to push: warming up or not worn
+            self._stalls += 1
+            if self._stalls >= self._max_stalls:
+                self._stop_with_message("No signal from Muse.\nWear it and retry.")
+                return
+            if not getattr(self.brain, "last_worn", True):
+                self.status.setText("Muse not detected on your head.\nWear it to continue.")
+            self.timer.start()  # re-arm the watchdog
+        else:
+            self._on_sample(float(f))
+
+    def _on_sample(self, f: float):
+        if not self._running:
+            return
+        self._last_sample_t = time.monotonic()
+        if self._push:
+            self.timer.start()  # re-arm the stall watchdog
+            if self._stalls:
+                self._stalls = 0
+                self.status.setText("Calibrating…")
+
         # warm-up skip
         self._warmup_seen += 1
         if self._warmup_seen <= self._warmup_samples_to_skip:
             # do not advance elapsed or progress for skipped samples
             return
 
-        self._elapsed += 1
-        self._samples.append(max(0.0, min(1.0, f)))
-
-        pct = (self._elapsed / max(1, self.seconds)) * 100.0
-        self._target_value = max(0.0, min(100.0, pct))
-
-        if self._elapsed >= self.seconds:
-            self.timer.stop()
-            self._running = False
+        # the first kept sample covers 1 s; from here the rest of the run is
+        # a fixed deadline on the monotonic Qt clock
+        if not self._deadline_armed:
+            self._deadline_armed = True
+            remaining_ms = max(0, (self.seconds - 1) * 1000)
+            self._progress_anim.setStartValue(int(100 / max(1, self.seconds)))
+            self._progress_anim.setDuration(remaining_ms)
+            self._progress_anim.start()
+            self._finish_timer.start(remaining_ms)
+        if self._n == self._samples.size:
+            self._samples = np.concatenate((self._samples, np.empty_like(self._samples)))
+        self._samples[self._n] = f  # clamped in one pass at completion
+        self._n += 1
+
+    def _finish(self):
+        if not self._running:
+            return
+        self._running = False
+        self._stop_timers()
+        self.progress.setValue(100)
 
-            # ✅ FIX: robust baseline (percentile), not mean
-            # This makes calibration fair across different brains.
-            samples = sorted(self._samples)
-            if not samples:
-                baseline_focus = 0.35
-            else:
-                idx = int(0.65 * len(samples))  # 65th percentile
-                idx = max(0, min(len(samples) - 1, idx))
-                baseline_focus = float(samples[idx])
+        # ✅ FIX: robust baseline (percentile), not mean
+        # This makes calibration fair across different brains.
+        if self._n == 0:
+            baseline_focus = 0.35
+        else:
+            arr = self._samples[:self._n]
+            np.clip(arr, 0.0, 1.0, out=arr)
+            idx = min(len(arr) - 1, int(0.65 * len(arr)))  # 65th percentile
+            baseline_focus = float(np.partition(arr, idx)[idx])
 
-            # ✅ Safety clamp to prevent "permanent red" on low-amplitude brains
-            baseline_focus = float(max(0.25, min(1.0, baseline_focus)))
+        # ✅ Safety clamp to prevent "permanent red" on low-amplitude brains
+        baseline_focus = float(max(0.25, min(1.0, baseline_focus)))
 
-            self._target_value = 100.0
-            self.progress.setStyleSheet(self._progress_style_done)
+        self._set_progress_done(True)
 
-            self.title.hide()
-            self.instructions.hide()
+        self.title.hide()
+        self.instructions.hide()
 
-            self.check.show()
-            self._play_success_feedback()
+        self.check.show()
+        self._play_success_feedback()
 
-            self.status.setText(
-                "Calibration completed\n"
-                "Starting session"
-            )
-            self.status.repaint()
-            QApplication.processEvents()
+        self.status.setText(
+            "Calibration completed\n"
+            "Starting session"
+        )
 
-            QTimer.singleShot(1200, lambda: self.on_done(baseline_focus))
+        QTimer.singleShot(1200, lambda: self.on_done(baseline_focus))
 
     def closeEvent(self, event):
         try:
-            if self.timer.isActive():
-                self.timer.stop()
-            if self._anim_timer.isActive():
-                self._anim_timer.stop()
+            self._stop_timers()
         finally:
             super().closeEvent(event)
\ No newline at end of file
@@ -1,4 +1,6 @@
 #neurotempo/ui/device_select.py
+import bisect
+import time
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QListWidget, QListWidgetItem, QHBoxLayout
@@ -7,15 +9,33 @@ from PySide6.QtCore import Qt
 
 from neurotempo.ui.muse_scan_worker import MuseScanWorker
 
+_SCAN_CACHE_SEC = 3.0  # a scan this recent is reused instead of re-scanning
+
+_BUTTON_QSS = """
+    QPushButton {
+        background: rgba(255,255,255,0.06);
+        border: 1px solid rgba(255,255,255,0.10);
+        border-radius: 12px;
+        padding: 10px 14px;
+        font-weight: 850;
+        min-width: 140px;
+    }
+    QPushButton:hover { background: rgba(255,255,255,0.10); }
+    QPushButton:pressed { background: rgba(255,255,255,0.14); }
+    QPushButton:disabled { opacity: 0.40; }
+"""
+
+
+# Band edges are exclusive (> -70 is "Nearby", > -55 is "Very close"), which
+# bisect_left gives us
+_RSSI_THRESHOLDS = (-70, -55)
+_RSSI_LABELS = ("Far", "Nearby", "Very close")
+
 
 def _rssi_label(rssi: int | None) -> str:
     if rssi is None:
         return ""
-    if rssi > -55:
-        return "Very close"
-    if rssi > -70:
-        return "Nearby"
-    return "Far"
+    return _RSSI_LABELS[bisect.bisect_left(_RSSI_THRESHOLDS, rssi)]
 
 
 class DeviceSelectScreen(QWidget):
@@ -25,6 +45,8 @@ class DeviceSelectScreen(QWidget):
         self.on_connected = on_connected
         self.worker: MuseScanWorker | None = None
         self._first_show = True
+        self._last_scan_monotonic = 0.0
+        self._last_scan_result: list | None = None
 
         root = QVBoxLayout(self)
         root.setContentsMargins(40, 40, 40, 40)
@@ -67,19 +89,7 @@ class DeviceSelectScreen(QWidget):
         self.connect_btn.setEnabled(False)
 
         for b in (self.refresh_btn, self.connect_btn):
-            b.setStyleSheet("""
-                QPushButton {
-                    background: rgba(255,255,255,0.06);
-                    border: 1px solid rgba(255,255,255,0.10);
-                    border-radius: 12px;
-                    padding: 10px 14px;
-                    font-weight: 850;
-                    min-width: 140px;
-                }
-                QPushButton:hover { background: rgba(255,255,255,0.10); }
-                QPushButton:pressed { background: rgba(255,255,255,0.14); }
-                QPushButton:disabled { opacity: 0.40; }
-            """)
+            b.setStyleSheet(_BUTTON_QSS)
 
         self.status = QLabel("Ready to scan.")
         self.status.setAlignment(Qt.AlignCenter)
@@ -110,8 +120,10 @@ class DeviceSelectScreen(QWidget):
             except Exception:
                 pass
             self.worker.quit()
-            self.worker.wait(1200)
-        self.worker = None
+            if not self.worker.wait(1200):
+                # still inside the BLE scan; let it finish (cancelled, parented)
+                # and use a fresh worker next time
+                self.worker = None
 
     def hideEvent(self, event):
         self._stop_worker()
@@ -133,23 +145,43 @@ class DeviceSelectScreen(QWidget):
     def refresh(self):
         self._stop_worker()
 
-        self.status.setText("Scanning nearby Muse…")
         self.list.clear()
         self.connect_btn.setEnabled(False)
 
-        self.worker = MuseScanWorker(timeout_s=4.0)
-        # parent it so it won’t be GC’d unexpectedly
-        self.worker.setParent(self)
+        if (
+            self._last_scan_result is not None
+            and time.monotonic() - self._last_scan_monotonic < _SCAN_CACHE_SEC
+        ):
+            self._on_scan_result(self._last_scan_result)
+            return
+
+        self.status.setText("Scanning nearby Muse…")
 
-        self.worker.result.connect(self._on_scan_result)
-        self.worker.error.connect(lambda msg: self.status.setText(f"Scan error: {msg}"))
-        self.worker.start()
+        if self.worker is None:
+            self.worker = MuseScanWorker(timeout_s=4.0)
+            # parent it so it won’t be GC’d unexpectedly
+            self.worker.setParent(self)
+
+            self.worker.result.connect(self._on_scan_done)
+            self.worker.error.connect(lambda msg: self.status.setText(f"Scan error: {msg}"))
+        self.worker.restart(timeout_s=4.0)
+
+    def _on_scan_done(self, devices: list):
+        # Only a hit is worth reusing: after "No Muse found" the user has likely
+        # just switched the headband on, so the next Refresh must really scan
+        if devices:
+            self._last_scan_monotonic = time.monotonic()
+            self._last_scan_result = devices
+        else:
+            self._last_scan_result = None
+        self._on_scan_result(devices)
 
     def _on_scan_result(self, devices: list):
         if not devices:
             self.status.setText("No Muse found. Turn it on and keep it close.")
             return
 
+        items = []
         for d in devices:
             name = d.get("name", "Muse")
             mac = d.get("id", "")
@@ -162,7 +194,16 @@ class DeviceSelectScreen(QWidget):
 
             item = QListWidgetItem(label)
             item.setData(Qt.UserRole, d)
-            self.list.addItem(item)
+            items.append(item)
+
+        # insert in one go so the list lays out once, not per item
+        self.list.setUpdatesEnabled(False)
+        try:
+            self.list.clear()
+            for item in items:
+                self.list.addItem(item)
+        finally:
+            self.list.setUpdatesEnabled(True)
 
         self.status.setText(f"Found {len(devices)} Muse device(s). Select one and Connect.")
 
@@ -1,3 +1,4 @@
+import functools
 from datetime import datetime
 from typing import Any, Dict, List
 
@@ -7,15 +8,40 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 from neurotempo.core.storage import SessionStore
 
-
+_BUTTON_QSS = """
+    QPushButton {
+        background: rgba(255,255,255,0.06);
+        border: 1px solid rgba(255,255,255,0.14);
+        border-radius: 12px;
+        padding: 8px 12px;
+        font-weight: 650;
+    }
+    QPushButton:hover {
+        background: rgba(255,255,255,0.14);
+    }
+"""
+
+_HEADER_QSS = """
+    QHeaderView::section {
+        padding-left: 12px;
+        padding-right: 12px;
+        text-align: left;
+        background: rgba(255,255,255,0.02);
+        border: none;
+        font-weight: 750;
+    }
+"""
+
+
+# Stored sessions never change, so their display strings are memoised
+@functools.lru_cache(maxsize=4096)
 def _fmt_dt(ts: str) -> str:
     try:
         dt = datetime.fromisoformat(ts)
@@ -26,6 +52,7 @@ def _fmt_dt(ts: str) -> str:
         return "—"
 
 
+@functools.lru_cache(maxsize=4096)
 def _fmt_dur(seconds: int) -> str:
     seconds = max(0, int(seconds))
     m = seconds // 60
@@ -37,6 +64,74 @@ def _fmt_dur(seconds: int) -> str:
     return f"{m:02d}:{s:02d}"
 
 
+_PCT = "{:d}%".format
+
+
+def _pct(x) -> str:
+    # truncates like the original int(... * 100) display
+    return _PCT(int(float(x) * 100))
+
+
+_COLUMNS = ("Date / Time", "Duration", "Baseline", "Avg Focus", "Breaks")
+_ALIGN_LEFT = Qt.AlignVCenter | Qt.AlignLeft
+_ALIGN_CENTER = Qt.AlignVCenter | Qt.AlignCenter
+_NUM_COL_W = 110  # px, the four numeric columns
+
+
+def _row_strings(it: Dict[str, Any]) -> tuple:
+    return (
+        _fmt_dt(str(it.get("timestamp_utc", ""))),
+        _fmt_dur(int(it.get("duration_s", 0))),
+        _pct(it.get("baseline", 0.0)),
+        _pct(it.get("avg_focus", 0.0)),
+        str(it.get("breaks", 0)),
+    )
+
+
+class SessionHistoryModel(QAbstractTableModel):
+    """Read-only view over the session dicts; cells are formatted on demand."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Dict[str, Any]] = []
+        self._rows: List[tuple | None] = []  # formatted strings, filled lazily
+
+    def set_items(self, items: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._items = items
+        self._rows = [None] * len(items)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole:
+            row = index.row()
+            cached = self._rows[row]
+            if cached is None:
+                cached = self._rows[row] = _row_strings(self._items[row])
+            return cached[col]
+        if role == Qt.TextAlignmentRole:
+            return _ALIGN_LEFT if col == 0 else _ALIGN_CENTER
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return _COLUMNS[section]
+        if role == Qt.TextAlignmentRole and section == 0:
+            return _ALIGN_LEFT
+        return None
+
+
 class SessionHistoryScreen(QWidget):
     def __init__(self, on_back, on_new_session, on_open_detail):
         super().__init__()
@@ -46,6 +141,8 @@ class SessionHistoryScreen(QWidget):
         self.on_open_detail = on_open_detail
         self.store = SessionStore()
         self._items: List[Dict[str, Any]] = []
+        self._loaded_mtime: int | None = None  # sessions file mtime at last load
+        self._dirty = True
 
         root = QVBoxLayout(self)
         root.setContentsMargins(28, 22, 28, 22)
@@ -68,18 +165,7 @@ class SessionHistoryScreen(QWidget):
         new_btn.setCursor(Qt.PointingHandCursor)
 
         for btn in (back_btn, new_btn):
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(255,255,255,0.06);
-                    border: 1px solid rgba(255,255,255,0.14);
-                    border-radius: 12px;
-                    padding: 8px 12px;
-                    font-weight: 650;
-                }
-                QPushButton:hover {
-                    background: rgba(255,255,255,0.14);
-                }
-            """)
+            btn.setStyleSheet(_BUTTON_QSS)
 
         header.addWidget(title, 1)
         header.addWidget(back_btn)
@@ -90,41 +176,31 @@ class SessionHistoryScreen(QWidget):
         # --------------------------------------------------
         # Table
         # --------------------------------------------------
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(
-            ["Date / Time", "Duration", "Baseline", "Avg Focus", "Breaks"]
-        )
+        self._model = SessionHistoryModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
 
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
         self.table.setShowGrid(False)
 
         # Header behavior
         hh = self.table.horizontalHeader()
         hh.setSectionResizeMode(0, QHeaderView.Stretch)
+        # Fixed widths: ResizeToContents would make the header format every
+        # row on each model reset. These cells are short ("1h 05m", "100%")
+        # and never wider than their header label.
         for i in range(1, 5):
-            hh.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+            hh.setSectionResizeMode(i, QHeaderView.Fixed)
+            self.table.setColumnWidth(i, _NUM_COL_W)
 
         # ---- HEADER ALIGNMENT FIX (THIS IS THE KEY PART)
-        hh.setStyleSheet("""
-            QHeaderView::section {
-                padding-left: 12px;
-                padding-right: 12px;
-                text-align: left;
-                background: rgba(255,255,255,0.02);
-                border: none;
-                font-weight: 750;
-            }
-        """)
-
-        header_item = self.table.horizontalHeaderItem(0)
-        if header_item:
-            header_item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
+        hh.setStyleSheet(_HEADER_QSS)
 
         # Row interaction
-        self.table.cellDoubleClicked.connect(self._open_row)
+        self.table.doubleClicked.connect(self._open_row)
 
         root.addWidget(self.table)
 
@@ -135,31 +211,34 @@ class SessionHistoryScreen(QWidget):
     # --------------------------------------------------
     def showEvent(self, event):
         super().showEvent(event)
-        self.refresh()
+        self.refresh_if_changed()
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def refresh_if_changed(self):
+        # Skip the disk read + model reset when no session was added since
+        if self._dirty or self._store_mtime() != self._loaded_mtime:
+            self.refresh()
+
+    def _store_mtime(self) -> int:
+        try:
+            return self.store.path.stat().st_mtime_ns
+        except OSError:
+            return -1
 
     def refresh(self):
-        self._items = list(self.store.load())[::-1]  # newest first
-        self.table.setRowCount(len(self._items))
-
-        for row, it in enumerate(self._items):
-            values = [
-                _fmt_dt(str(it.get("timestamp_utc", ""))),
-                _fmt_dur(int(it.get("duration_s", 0))),
-                f"{int(float(it.get('baseline', 0)) * 100)}%",
-                f"{int(float(it.get('avg_focus', 0)) * 100)}%",
-                str(it.get("breaks", 0)),
-            ]
-
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                item.setTextAlignment(
-                    Qt.AlignVCenter | (Qt.AlignLeft if col == 0 else Qt.AlignCenter)
-                )
-                self.table.setItem(row, col, item)
+        self._loaded_mtime = self._store_mtime()
+        self._dirty = False
+        items = self.store.load()  # fresh list owned by us
+        items.reverse()  # newest first, in place
+        self._items = items
+        self._model.set_items(self._items)
 
     # --------------------------------------------------
     # Navigation
     # --------------------------------------------------
-    def _open_row(self, row: int, col: int):
+    def _open_row(self, index: QModelIndex):
+        row = index.row()
         if 0 <= row < len(self._items):
             self.on_open_detail(self._items[row])
\ No newline at end of file
@@ -505,12 +505,14 @@ class MainWindow(QMainWindow):
         self.stack.setCurrentWidget(self.session)
 
     def go_summary(self, summary: dict):
+        # the session just appended its record; don't rely on mtime granularity
+        self.history.mark_dirty()
         self.summary.set_summary(summary)
         self.stack.setCurrentWidget(self.summary)
 
     def go_history(self, *_):
         try:
-            self.history.refresh()
+            self.history.refresh_if_changed()
         except Exception:
             pass
         self.stack.setCurrentWidget(self.history)
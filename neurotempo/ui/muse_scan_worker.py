@@ -16,10 +16,18 @@ class MuseScanWorker(QThread):
     def cancel(self):
         self._cancelled = True
 
+    def restart(self, timeout_s: float | None = None):
+        # QThread objects can be started again once finished
+        if timeout_s is not None:
+            self.timeout_s = timeout_s
+        self._cancelled = False
+        self.start()
+
     def run(self):
         try:
             if self._cancelled:
                 return
+            # full timeout so every headband in range is listed, strongest first
             devices = asyncio.run(scan_nearby_muse(self.timeout_s))
             if self._cancelled:
                 return
@@ -70,7 +70,7 @@ class SessionScreen(QWidget):
         self.signal_ok = True
 
         # stats
-        self.start_ts = time.time()
+        self.start_ts = time.monotonic()
         self.samples = 0
         self.focus_sum = 0.0
 
@@ -336,7 +336,7 @@ class SessionScreen(QWidget):
         self.fatigue_ema = (1.0 - a) * self.fatigue_ema + a * float(m.fatigue)
 
         # Break logic
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.start_ts
         threshold = self._low_threshold()
         fatigue_gate = self._fatigue_gate()
@@ -408,7 +408,7 @@ class SessionScreen(QWidget):
         except Exception:
             pass
 
-        duration_s = int(time.time() - self.start_ts)
+        duration_s = int(time.monotonic() - self.start_ts)
 
         avg_focus = (self.focus_sum / self.samples) if self.samples > 0 else float(self.focus_ema)
         avg_hr = int(round(self.hr_sum / self.hr_samples)) if self.hr_samples > 0 else 0
@@ -427,6 +427,9 @@ class SessionScreen(QWidget):
             self.store.append_from_summary(summary)
         except Exception:
             pass
+        finally:
+            # one record per session: fsync and release the append handle now
+            self.store.close()
 
         self.on_end(summary)
 
@@ -435,5 +438,6 @@ class SessionScreen(QWidget):
             if self.timer.isActive():
                 self.timer.stop()
             self.logger.close()
+            self.store.close()
         finally:
             super().closeEvent(event)
\ No newline at end of file